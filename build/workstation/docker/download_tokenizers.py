@@ -0,0 +1,64 @@
+import json
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List
+
+import tiktoken
+from transformers import AutoTokenizer
+
+HUGGING_FACE_TOKENIZER_PROVIDERS = ("hugging_face", "voyage")
+TIKTOKEN_PROVIDERS = ("openai",)
+
+
+def arg_parser() -> Namespace:
+    """Parse the arguments.
+
+    Parse the arguments from the command line."""
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--env",
+        type=str,
+        help="Name of the runtime environment",
+        default="default",
+    )
+    return parser.parse_args()
+
+
+def get_embedding_models(environment: str) -> List[Dict[str, Any]]:
+    """Get the embedding model configurations of the environment.
+
+    Only the embedding model and the evaluation judge embedding model are read,
+    so the raw configuration file is parsed without validating it.
+
+    Args:
+        environment: Name of the runtime environment
+
+    Returns:
+        List[Dict[str, Any]]: Embedding model configurations
+    """
+    with open(f"configurations/configuration.{environment}.json") as f:
+        pipeline = json.load(f)["pipeline"]
+    return [
+        pipeline["embedding"]["embedding_model"],
+        pipeline.get("evaluation", {}).get("judge_embedding_model", {}),
+    ]
+
+
+def main():
+    """Download the tokenizers of the configured embedding models.
+
+    Hugging Face tokenizers are stored in the Hugging Face cache and tiktoken encodings
+    in `TIKTOKEN_CACHE_DIR`, so the runtime loads them from the image.
+    """
+    args = arg_parser()
+    for model in get_embedding_models(args.env):
+        provider = model.get("provider")
+        if provider in HUGGING_FACE_TOKENIZER_PROVIDERS:
+            AutoTokenizer.from_pretrained(
+                model["tokenizer_name"], use_fast=True
+            )
+        elif provider in TIKTOKEN_PROVIDERS:
+            tiktoken.encoding_for_model(model["tokenizer_name"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
 import sys
-from typing import Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 sys.path.append("./src")
 
 import os
 import socket
 import subprocess
+import threading
+import time
 from argparse import ArgumentParser, Namespace
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from python_on_whales import DockerClient
@@ -33,23 +35,46 @@ class Logger(object):
             filename: The name of the log file
         """
         self.terminal = sys.stdout
-        self.log_file = open(filename, "a")
+        self.log_file = open(filename, "a", buffering=1)
+        self._last_timestamp_second = 0
+        self._last_timestamp_prefix = ""
+        self._lock = threading.Lock()
         sys.stdout = self
 
     def write(self, message: str):
         """Write the message to the terminal and log file.
 
         Add the timestamp to the message and write it to the terminal and log file.
+        The terminal is flushed on each message, so it stays in order with the output of docker compose.
+        The log file is line buffered, so it is flushed on each written line without explicit flush.
+        Writes are serialized, so the logger can be used from multiple threads.
 
         Args:
             message: The message to write
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         if message.strip():
-            message = f"[{timestamp}] {message}\n"
-            self.terminal.write(message)
-            self.log_file.write(message)
-            self.flush()
+            with self._lock:
+                message = f"{self._get_timestamp_prefix()}{message}\n"
+                self.terminal.write(message)
+                self.terminal.flush()
+                self.log_file.write(message)
+
+    def _get_timestamp_prefix(self) -> str:
+        """Get the timestamp prefix of the message.
+
+        The formatted timestamp is cached and reused for all the messages written within the same second.
+
+        Returns:
+            str: The timestamp prefix
+        """
+        second = int(time.time())
+        if second != self._last_timestamp_second:
+            timestamp = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(second)
+            )
+            self._last_timestamp_second = second
+            self._last_timestamp_prefix = f"[{timestamp}] "
+        return self._last_timestamp_prefix
 
     def flush(self):
         """Flush the output to the terminal and log file."""
@@ -67,8 +92,13 @@ class CommandRunner:
         build_name: The name of the build to deploy
         environment: Name of runtime environment
         docker_compose_filename: The file containing the docker-compose configuration
+        vector_store_configuration: Vector store part of the configuration
+        langfuse_configuration: Langfuse part of the configuration
+        chainlit_configuration: Chainlit part of the configuration
     """
 
+    PORT_PROBE_TIMEOUT = 0.1
+
     def __init__(
         self,
         logger: Logger,
@@ -92,6 +122,10 @@ class CommandRunner:
             self._get_configuration_and_secrets_filepaths(environment)
         )
 
+        self._port_status: Dict[int, bool] = {}
+
+        os.environ["DOCKER_BUILDKIT"] = "1"
+        os.environ["COMPOSE_DOCKER_CLI_BUILD"] = "1"
         self.docker_client = DockerClient(
             compose_files=[docker_compose_filename],
             compose_env_files=[self.secrets_filename],
@@ -99,16 +133,28 @@ class CommandRunner:
         self.logger.write(
             f"Deployment with build name {self.build_name} started."
         )
-        with open(self.configuration_filename) as f:
-            self.configuration_json = f.read()
-        self.configuration = Configuration.model_validate_json(
-            self.configuration_json,
-            context={"secrets_file": self.secrets_filename},
+        self.configuration = self._load_configuration()
+        if os.environ.get("RAG_DEBUG_CONFIG"):
+            print(f"::{self.configuration_filename}")
+            print(self.configuration.model_dump_json(indent=4))
+
+        self.configuration = self.configuration.model_copy(
+            update={
+                "metadata": self.configuration.metadata.model_copy(
+                    update={"build_name": build_name}
+                )
+            }
         )
-        print(f"::{self.configuration_filename}")
-        print(self.configuration.model_dump_json(indent=4))
-
-        self.configuration.metadata.build_name = build_name
+        self.vector_store_configuration = (
+            self.configuration.pipeline.embedding.vector_store
+        )
+        self.langfuse_configuration = (
+            self.configuration.pipeline.augmentation.langfuse
+        )
+        self.chainlit_configuration = (
+            self.configuration.pipeline.augmentation.chainlit
+        )
+        self._export_build_configuration()
         self._export_port_configuration()
 
     def is_port_in_use(self, port: int) -> bool:
@@ -117,11 +163,75 @@ class CommandRunner:
         Args:
             port: The port to check
 
+        Returns:
+            bool: True if the port is in use, False otherwise
+        """
+        if port not in self._port_status:
+            self.probe_ports([port])
+        return self._port_status[port]
+
+    def probe_ports(self, ports: Iterable[int]) -> Dict[int, bool]:
+        """Probe the ports concurrently.
+
+        Check which of the ports are in use and cache the results, so the subsequent
+        `is_port_in_use` calls do not reopen the sockets. Each probe is bounded by a timeout.
+
+        Args:
+            ports: The ports to probe
+
+        Returns:
+            Dict[int, bool]: Mapping of the port to whether it is in use
+        """
+        ports = set(ports)
+        if ports:
+            with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+                self._port_status.update(
+                    zip(ports, executor.map(self._probe_port, ports))
+                )
+        return {port: self._port_status[port] for port in ports}
+
+    def _probe_port(self, port: int) -> bool:
+        """Probe the port.
+
+        The connection attempt is bounded by the timeout, so a filtered port does not block
+        the probe. Ports that time out or fail to connect are treated as not in use.
+
+        Args:
+            port: The port to probe
+
         Returns:
             bool: True if the port is in use, False otherwise
         """
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(("localhost", port)) == 0
+            s.settimeout(CommandRunner.PORT_PROBE_TIMEOUT)
+            try:
+                return s.connect_ex(("localhost", port)) == 0
+            except OSError:
+                return False
+
+    def prebuild_services(self, services: List[str]) -> int:
+        """Build the docker services.
+
+        Build all indicated docker services from the composer with a single invocation,
+        so the builds can be parallelized by docker.
+
+        Args:
+            services: The names of the services to build
+
+        Returns:
+            int: The return code of the command
+        """
+        try:
+            self.logger.write(
+                f"Building docker services: {', '.join(services)}"
+            )
+            self.docker_client.compose.build(services=services)
+            return 0
+        except DockerException as e:
+            self.logger.write(
+                f"Error building docker services: {services}. Error: {e}. Args: {e.args}"
+            )
+            return e.return_code
 
     def run_docker_service(
         self,
@@ -131,8 +241,8 @@ class CommandRunner:
     ) -> int:
         """Run the docker service.
 
-        Run indicated docker service from the composer. If flagged, the service is built before running.
-        Use detached mode for services that shouldn't be awaited.
+        Run indicated docker service from the composer. If flagged, the service is built
+        within the same `compose up` invocation. Use detached mode for services that shouldn't be awaited.
 
         Args:
             service_name: The name of the service to run
@@ -142,30 +252,66 @@ class CommandRunner:
         Returns:
             int: The return code of the command
         """
-        try:
-            if build:
-                self.logger.write(f"Building docker service: {service_name}")
-                self.docker_client.compose.build(
-                    services=[service_name],
-                    build_args={
-                        "BUILD_NAME": self.build_name,
-                        "ENV": self.environment,
-                    },
-                )
+        return self.run_docker_services(
+            [service_name], detached=detached, build=build
+        )
 
-            self.logger.write(f"Running docker service: {service_name}")
+    def run_docker_services(
+        self,
+        service_names: List[str],
+        detached: bool = False,
+        build: bool = True,
+    ) -> int:
+        """Run the docker services.
+
+        Run all indicated docker services from the composer with a single `compose up` invocation.
+
+        Args:
+            service_names: The names of the services to run
+            detached: Whether to run the services in detached mode
+            build: Whether to build the services before running
+
+        Returns:
+            int: The return code of the command
+        """
+        try:
+            self.logger.write(
+                f"Running docker services: {', '.join(service_names)}"
+            )
             self.docker_client.compose.up(
-                services=[service_name],
+                services=service_names,
+                build=build,
                 detach=detached,
                 abort_on_container_exit=not detached,
             )
             return 0
         except DockerException as e:
             self.logger.write(
-                f"Error running docker service: {service_name}. Error: {e}. Args: {e.args}"
+                f"Error running docker services: {service_names}. Error: {e}. Args: {e.args}"
             )
             return e.return_code
 
+    def get_running_services(self) -> Set[str]:
+        """Get the running docker services.
+
+        List the containers of the compose project with a single `compose ps` call.
+
+        Returns:
+            Set[str]: The names of the running services
+        """
+        try:
+            containers = self.docker_client.compose.ps(all=True)
+        except DockerException as e:
+            self.logger.write(
+                f"Error listing docker services. Error: {e}. Args: {e.args}"
+            )
+            return set()
+        return {
+            container.config.labels.get("com.docker.compose.service")
+            for container in containers
+            if container.state.running
+        }
+
     def cleanup(self) -> int:
         """Clean up the Docker resources.
 
@@ -177,6 +323,19 @@ class CommandRunner:
         self.logger.write("Cleaning up Docker resources")
         self.docker_client.system.prune(all=True, volumes=True)
 
+    def _load_configuration(self) -> Configuration:
+        """Read and validate the configuration file.
+
+        Returns:
+            Configuration: The parsed configuration
+        """
+        with open(self.configuration_filename) as f:
+            configuration_json = f.read()
+        return Configuration.model_validate_json(
+            configuration_json,
+            context={"secrets_file": self.secrets_filename},
+        )
+
     def _get_configuration_and_secrets_filepaths(
         self, environment: str
     ) -> Tuple[str, str]:
@@ -195,38 +354,45 @@ class CommandRunner:
         secrets_filepath = f"configurations/secrets.{environment}.env"
         return configuration_filepath, secrets_filepath
 
+    def _export_build_configuration(self):
+        """Export the build configuration.
+
+        Export the build arguments to the environment variables.
+        It is required for docker-compose, so the build args of the services can be resolved
+        when the services are built as part of `compose up`.
+        """
+        os.environ.update(
+            {
+                "RAG__BUILD_NAME": self.build_name,
+                "RAG__ENVIRONMENT": self.environment,
+            }
+        )
+
     def _export_port_configuration(self):
         """Export the port configuration.
 
         Export the port configuration to the environment variables.
         It is required for docker-compose, so it is able to use ports from the configuration.
         """
-        vector_store_configuration = (
-            self.configuration.pipeline.embedding.vector_store
-        )
-        os.environ["RAG__VECTOR_STORE__PORT_REST"] = str(
-            vector_store_configuration.ports.rest
-        )
-
-        langfuse_configuration = (
-            self.configuration.pipeline.augmentation.langfuse
-        )
-        os.environ["RAG__LANGFUSE__DATABASE__PORT"] = str(
-            langfuse_configuration.database.port
-        )
-        os.environ["RAG__LANGFUSE__DATABASE__NAME"] = (
-            langfuse_configuration.database.db
-        )
-        os.environ["RAG__LANGFUSE__DATABASE__USER"] = (
-            langfuse_configuration.database.secrets.user.get_secret_value()
-        )
-        os.environ["RAG__LANGFUSE__DATABASE__PASSWORD"] = (
-            langfuse_configuration.database.secrets.password.get_secret_value()
-        )
-        os.environ["RAG__LANGFUSE__PORT"] = str(langfuse_configuration.port)
-
-        os.environ["RAG__CHAINLIT__PORT"] = str(
-            self.configuration.pipeline.augmentation.chainlit.port
+        vector_store_configuration = self.vector_store_configuration
+        langfuse_configuration = self.langfuse_configuration
+        langfuse_database_configuration = langfuse_configuration.database
+        langfuse_database_secrets = langfuse_database_configuration.secrets
+
+        os.environ.update(
+            {
+                "RAG__VECTOR_STORE__PORT_REST": str(
+                    vector_store_configuration.ports.rest
+                ),
+                "RAG__LANGFUSE__DATABASE__PORT": str(
+                    langfuse_database_configuration.port
+                ),
+                "RAG__LANGFUSE__DATABASE__NAME": langfuse_database_configuration.db,
+                "RAG__LANGFUSE__DATABASE__USER": langfuse_database_secrets.user.get_secret_value(),
+                "RAG__LANGFUSE__DATABASE__PASSWORD": langfuse_database_secrets.password.get_secret_value(),
+                "RAG__LANGFUSE__PORT": str(langfuse_configuration.port),
+                "RAG__CHAINLIT__PORT": str(self.chainlit_configuration.port),
+            }
         )
 
 
@@ -266,6 +432,7 @@ class Deployment:
         Run the deployment of the services using the Docker Compose.
         If the unit tests fail, the deployment is stopped.
 
+        All the services are built upfront in a single build invocation.
         The services are run in the following order:
         - Unit tests
         - Embedding
@@ -274,20 +441,27 @@ class Deployment:
 
         If the service is not detached, it is awaited and its logs are redirected to the log file.
         """
+        return_code = self.command_runner.prebuild_services(
+            [service.value for service in Deployment.ServiceName]
+        )
+        if return_code != 0:
+            self.logger.write("Services build failed. Exiting deployment.")
+            sys.exit(1)
+
         return_code = self.command_runner.run_docker_service(
-            Deployment.ServiceName.UNIT_TESTS.value
+            Deployment.ServiceName.UNIT_TESTS.value, build=False
         )
         if return_code != 0:
             self.logger.write("Unit tests failed. Exiting deployment.")
             sys.exit(1)
         self.command_runner.run_docker_service(
-            Deployment.ServiceName.EMBEDDING.value
+            Deployment.ServiceName.EMBEDDING.value, build=False
         )
         self.command_runner.run_docker_service(
-            Deployment.ServiceName.CHAT.value, detached=True
+            Deployment.ServiceName.CHAT.value, detached=True, build=False
         )
         self.command_runner.run_docker_service(
-            Deployment.ServiceName.EVALUATION.value
+            Deployment.ServiceName.EVALUATION.value, build=False
         )
 
 
@@ -329,18 +503,55 @@ class Initialization:
         - Vector store
         - Langfuse database
         - Langfuse
+
+        Ports of all the services are probed upfront in a single pass, running compose services
+        are listed once and the services that are not yet running are started with a single invocation.
         """
-        self._init_vector_store()
-        self._init_langfuse_database()
-        self._init_langfuse()
+        langfuse_configuration = self.command_runner.langfuse_configuration
+        self.command_runner.probe_ports(
+            [
+                self.command_runner.vector_store_configuration.ports.rest,
+                langfuse_configuration.database.port,
+                langfuse_configuration.port,
+            ]
+        )
+        service_names = [
+            service_name
+            for service_name in (
+                self._get_vector_store_service(),
+                self._get_langfuse_database_service(),
+                self._get_langfuse_service(),
+            )
+            if service_name
+        ]
+        if service_names:
+            running_service_names = self.command_runner.get_running_services()
+            for service_name in running_service_names.intersection(
+                service_names
+            ):
+                self.logger.write(
+                    f"Service {service_name} is already running. Skipping its initialization."
+                )
+            service_names = [
+                service_name
+                for service_name in service_names
+                if service_name not in running_service_names
+            ]
+        if service_names:
+            self.command_runner.run_docker_services(
+                service_names, detached=True
+            )
 
-    def _init_vector_store(self) -> None:
-        """Initialize the vector store.
+    def _get_vector_store_service(self) -> Optional[str]:
+        """Get the vector store service to initialize.
 
-        Initialize the vector store service using the Docker Compose.
-        If the ports are already in use, the initialization is skipped."""
+        If the ports are already in use, the initialization is skipped.
+
+        Returns:
+            Optional[str]: The name of the service or None if it is skipped
+        """
         vector_store_configuration = (
-            self.command_runner.configuration.pipeline.embedding.vector_store
+            self.command_runner.vector_store_configuration
         )
         vector_store_port_rest = vector_store_configuration.ports.rest
 
@@ -348,49 +559,44 @@ class Initialization:
             self.logger.write(
                 f"REST port {vector_store_port_rest} is already in use. Skipping {vector_store_configuration.name.value} initialization."
             )
-            return
-        else:
-            self.command_runner.run_docker_service(
-                vector_store_configuration.name.value, detached=True
-            )
+            return None
+        return vector_store_configuration.name.value
 
-    def _init_langfuse_database(self) -> None:
-        """Initialize the langfuse database.
+    def _get_langfuse_database_service(self) -> Optional[str]:
+        """Get the langfuse database service to initialize.
 
-        Initialize the langfuse database service using the Docker Compose."""
-        langfuse_configuration = (
-            self.command_runner.configuration.pipeline.augmentation.langfuse
-        )
+        If the port is already in use, the initialization is skipped.
+
+        Returns:
+            Optional[str]: The name of the service or None if it is skipped
+        """
+        langfuse_configuration = self.command_runner.langfuse_configuration
         langfuse_db_port = langfuse_configuration.database.port
 
         if self.command_runner.is_port_in_use(langfuse_db_port):
             self.logger.write(
                 f"Port {langfuse_db_port} is already in use. Skipping langfuse database server initialization."
             )
-            return
-        else:
-            self.command_runner.run_docker_service(
-                Initialization.ServiceName.LANGFUSE_DB.value, detached=True
-            )
+            return None
+        return Initialization.ServiceName.LANGFUSE_DB.value
 
-    def _init_langfuse(self) -> None:
-        """Initialize the langfuse.
+    def _get_langfuse_service(self) -> Optional[str]:
+        """Get the langfuse service to initialize.
 
-        Initialize the langfuse service using the Docker Compose."""
-        langfuse_configuration = (
-            self.command_runner.configuration.pipeline.augmentation.langfuse
-        )
+        If the port is already in use, the initialization is skipped.
+
+        Returns:
+            Optional[str]: The name of the service or None if it is skipped
+        """
+        langfuse_configuration = self.command_runner.langfuse_configuration
         langfuse_port = langfuse_configuration.port
 
         if self.command_runner.is_port_in_use(langfuse_port):
             self.logger.write(
                 f"Port {langfuse_port} is already in use. Skipping langfuse initialization."
             )
-            return
-        else:
-            self.command_runner.run_docker_service(
-                Initialization.ServiceName.LANGFUSE.value, detached=True
-            )
+            return None
+        return Initialization.ServiceName.LANGFUSE.value
 
 
 def arg_parser() -> Namespace:
@@ -449,9 +655,6 @@ def deploy(logger: Logger, command_runner: CommandRunner) -> None:
     try:
         logger.write("Start deployment.")
         Deployment(command_runner=command_runner, logger=logger).run()
-        logger.write(
-            f"Deployment with build name {command_runner.build_name} finished."
-        )
     finally:
         command_runner.cleanup()
         logger.write(
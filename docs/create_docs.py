@@ -1,12 +1,19 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 # Base paths
 SRC_DIR = "src"
 DOCS_DIR = "docs/src"
 MKDOCS_FILE = "mkdocs.yml"
+WRITE_WORKERS = 8
 
 
 SECTION_TEMPLATE = """## {section_name}
@@ -48,9 +55,32 @@ def clean_docs_directory(docs_dir: str):
     print(f"Created fresh documentation directory: {docs_dir}")
 
 
-def generate_markdown_template(base_dir, docs_dir, parent_module):
+def write_files(files: dict):
+    """
+    Write the generated files in a single pass.
+
+    Each file is written to a temporary path and moved into place with `os.replace`.
+
+    :param files: Mapping of the file path to its content.
+    """
+
+    def write_file(path: str, content: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(content.encode("utf-8"))
+        os.replace(temporary_path, path)
+        print(f"Generated: {path}")
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        list(executor.map(write_file, files.keys(), files.values()))
+
+
+def generate_markdown_template(base_dir, docs_dir, parent_module, files):
     """
     Aggregate documentation for all files in a datasource folder.
+
+    The generated content is collected in `files` instead of being written.
     """
     module_name = os.path.basename(base_dir)
     module_doc_path = os.path.join(docs_dir, f"{module_name}.md")
@@ -61,10 +91,12 @@ def generate_markdown_template(base_dir, docs_dir, parent_module):
     sections = []
     builders_section = None
 
-    for entry in sorted(os.listdir(base_dir)):
-        entry_path = os.path.join(base_dir, entry)
-        if entry.endswith(".py") and not entry.startswith("__"):
-            file_name = os.path.splitext(entry)[0]
+    with os.scandir(base_dir) as iterator:
+        entries = sorted(iterator, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.name.endswith(".py") and not entry.name.startswith("__"):
+            file_name = entry.name[:-3]
             full_import_path = f"{parent_module}.{module_name}.{file_name}"
             section = SECTION_TEMPLATE.format(
                 section_name=file_name.capitalize(),
@@ -78,18 +110,11 @@ def generate_markdown_template(base_dir, docs_dir, parent_module):
     if builders_section:
         sections.append(builders_section)
 
-    os.makedirs(docs_dir, exist_ok=True)
-    with open(module_doc_path, "w") as md_file:
-        template = (
-            DATASOURCE_MD_TEMPLATE if is_datasource else REGULAR_MD_TEMPLATE
-        )
-        md_file.write(
-            template.format(
-                module_name=module_name.capitalize(),
-                sections="\n".join(sections),
-            )
-        )
-    print(f"Generated: {module_doc_path}")
+    template = DATASOURCE_MD_TEMPLATE if is_datasource else REGULAR_MD_TEMPLATE
+    files[module_doc_path] = template.format(
+        module_name=module_name.capitalize(),
+        sections="\n".join(sections),
+    )
 
     return {module_name.capitalize(): os.path.relpath(module_doc_path, "docs")}
 
@@ -98,59 +123,89 @@ def generate_markdown_files(base_dir, docs_dir, parent_module="src"):
     """
     Generate Markdown documentation for the entire project structure.
 
+    The source tree is traversed with a single `os.walk` pass. Navigation entries of
+    subdirectories are linked to their parent entries before the subdirectories are visited.
+
     :param base_dir: Source directory to scan.
     :param docs_dir: Destination directory for the documentation.
     :param parent_module: Parent module name to construct import paths.
     """
+    files = {}
     nav_entries = []
-
-    for entry in os.listdir(base_dir):
-        entry_path = os.path.join(base_dir, entry)
-
-        # Special handling for `embedding/datasources`
-        if os.path.basename(base_dir) == "datasources" and os.path.isdir(
-            entry_path
-        ):
-            nav_entries.append(
-                generate_markdown_template(entry_path, docs_dir, parent_module)
+    nav_entries_by_dir = {base_dir: nav_entries}
+
+    for dir_path, dir_names, file_names in os.walk(base_dir, topdown=True):
+        relative_path = os.path.relpath(dir_path, base_dir)
+        if relative_path == os.curdir:
+            dir_docs_dir = docs_dir
+            dir_module = parent_module
+        else:
+            dir_docs_dir = os.path.join(docs_dir, relative_path)
+            dir_module = ".".join(
+                filter(None, [parent_module, *relative_path.split(os.sep)])
             )
-        elif os.path.isdir(entry_path) and not entry.startswith("__"):
-            # Process subdirectories recursively
-            module_name = f"{parent_module}.{entry}" if parent_module else entry
-            module_docs_dir = os.path.join(docs_dir, entry)
-            nav_entries.append(
-                {
-                    entry.capitalize(): generate_markdown_files(
-                        entry_path, module_docs_dir, module_name
+        dir_nav_entries = nav_entries_by_dir[dir_path]
+        dir_names[:] = sorted(
+            name for name in dir_names if not name.startswith("__")
+        )
+        is_datasources_dir = os.path.basename(dir_path) == "datasources"
+
+        entry_names = sorted(
+            dir_names
+            + [
+                name
+                for name in file_names
+                if name.endswith(".py") and not name.startswith("__")
+            ]
+        )
+        for entry_name in entry_names:
+            entry_path = os.path.join(dir_path, entry_name)
+
+            # Special handling for `embedding/datasources`
+            if is_datasources_dir and entry_name in dir_names:
+                dir_nav_entries.append(
+                    generate_markdown_template(
+                        entry_path, dir_docs_dir, dir_module, files
                     )
-                }
-            )
-        elif entry.endswith(".py") and not entry.startswith("__"):
-            # Process individual Python files
-            file_name = os.path.splitext(entry)[0]
-            full_import_path = (
-                f"{parent_module}.{file_name}" if parent_module else file_name
-            )
-            md_file_path = os.path.join(docs_dir, f"{file_name}.md")
-            sections = SECTION_TEMPLATE.format(
-                section_name=file_name.capitalize(),
-                full_import_path=full_import_path,
-            )
-            module_description = get_module_description(
-                file_name, parent_module
-            )
-            md_content = REGULAR_MD_TEMPLATE.format(
-                module_name=file_name.capitalize(),
-                module_description=module_description,
-                sections=sections,
-            )
-            os.makedirs(docs_dir, exist_ok=True)
-            with open(md_file_path, "w") as md_file:
-                md_file.write(md_content)
-            nav_entries.append(
-                {file_name.capitalize(): os.path.relpath(md_file_path, "docs")}
-            )
-            print(f"Generated: {md_file_path}")
+                )
+            elif entry_name in dir_names:
+                # Link subdirectory entries, filled when the subdirectory is visited
+                nav_entries_by_dir[entry_path] = []
+                dir_nav_entries.append(
+                    {entry_name.capitalize(): nav_entries_by_dir[entry_path]}
+                )
+            else:
+                # Process individual Python files
+                file_name = entry_name[:-3]
+                full_import_path = (
+                    f"{dir_module}.{file_name}" if dir_module else file_name
+                )
+                md_file_path = os.path.join(dir_docs_dir, f"{file_name}.md")
+                sections = SECTION_TEMPLATE.format(
+                    section_name=file_name.capitalize(),
+                    full_import_path=full_import_path,
+                )
+                module_description = get_module_description(
+                    file_name, dir_module
+                )
+                files[md_file_path] = REGULAR_MD_TEMPLATE.format(
+                    module_name=file_name.capitalize(),
+                    module_description=module_description,
+                    sections=sections,
+                )
+                dir_nav_entries.append(
+                    {
+                        file_name.capitalize(): os.path.relpath(
+                            md_file_path, "docs"
+                        )
+                    }
+                )
+
+        # Datasources are aggregated by the template, so they are not traversed further
+        if is_datasources_dir:
+            dir_names[:] = []
+
+    write_files(files)
 
     return nav_entries
 
@@ -253,10 +308,16 @@ def update_mkdocs_yml(nav_structure):
     }
 
     # Write the configuration to mkdocs.yml
-    with open(MKDOCS_FILE, "w") as file:
-        yaml.dump(config, file, default_flow_style=False)
-
-    print(f"Updated: {MKDOCS_FILE}")
+    write_files(
+        {
+            MKDOCS_FILE: yaml.dump(
+                config,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        }
+    )
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 from chainlit.types import Feedback
 from langfuse import Langfuse
@@ -11,8 +15,12 @@ from langfuse.api.resources.commons.types.trace_with_details import (
 
 from common.bootstrap.configuration.pipeline.augmentation.langfuse.langfuse_configuration import (
     LangfuseDatasetConfiguration,
+    split_chainlit_tag_format,
+)
+from common.exceptions import (
+    ObservationNotFoundException,
+    TraceNotFoundException,
 )
-from common.exceptions import TraceNotFoundException
 from common.langfuse.dataset import LangfuseDatasetService
 
 
@@ -25,6 +33,8 @@ class ChainlitFeedbackService:
 
     Attributes:
         SCORE_NAME: Name used for feedback scores in Langfuse.
+        TRACE_CACHE_SIZE: Maximum number of cached traces.
+        TRACE_CACHE_TTL: Time in seconds after which cached traces expire.
         langfuse_dataset_service: Service for managing Langfuse datasets.
         langfuse_client: Client for Langfuse API interactions.
         feedback_dataset: Configuration for feedback dataset.
@@ -32,6 +42,8 @@ class ChainlitFeedbackService:
     """
 
     SCORE_NAME = "User Feedback"
+    TRACE_CACHE_SIZE = 1024
+    TRACE_CACHE_TTL = 300
 
     def __init__(
         self,
@@ -52,6 +64,13 @@ class ChainlitFeedbackService:
         self.langfuse_client = langfuse_client
         self.feedback_dataset = feedback_dataset
         self.chainlit_tag_format = chainlit_tag_format
+        self._tag_prefix, self._tag_suffix = split_chainlit_tag_format(
+            chainlit_tag_format
+        )
+        self._trace_cache: OrderedDict[str, Tuple[float, TraceWithDetails]] = (
+            OrderedDict()
+        )
+        self._trace_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
 
         self.langfuse_dataset_service.create_if_does_not_exist(feedback_dataset)
 
@@ -69,14 +88,17 @@ class ChainlitFeedbackService:
         """
         trace = None
         try:
-            trace = self._fetch_trace(feedback.forId)
+            trace = await self._get_trace(feedback.forId)
 
             if self._is_positive(feedback):
                 logging.info(
-                    f"Uploading trace {trace.id} to dataset {self.feedback_dataset.name}."
+                    "Uploading trace %s to dataset %s.",
+                    trace.id,
+                    self.feedback_dataset.name,
                 )
-                self._upload_trace_to_dataset(trace)
+                await self._upload_trace_to_dataset(trace)
 
+            # Score is only queued here, it is sent by the Langfuse client's background batcher
             self.langfuse_client.score(
                 trace_id=trace.id,
                 name=ChainlitFeedbackService.SCORE_NAME,
@@ -84,16 +106,63 @@ class ChainlitFeedbackService:
                 comment=feedback.comment,
             )
             logging.info(
-                f"Upserted feedback for {trace.id} trace with value {feedback.value}."
+                "Upserted feedback for %s trace with value %s.",
+                trace.id,
+                feedback.value,
             )
             return True
         except Exception as e:
             trace_id = trace.id if trace else None
             logging.warning(
-                f"Failed to upsert feedback for {trace_id} trace: {e}"
+                "Failed to upsert feedback for %s trace: %s", trace_id, e
             )
             return False
 
+    async def _get_trace(self, message_id: str) -> TraceWithDetails:
+        """Get trace by message ID, using the cache of recently fetched traces.
+
+        Concurrent lookups of the same message ID are collapsed into a single fetch.
+        Each message lock counts its users and is dropped once the last one is done.
+        Missing traces are not cached.
+
+        Args:
+            message_id: Message identifier to get trace for.
+
+        Returns:
+            TraceWithDetails: Found trace object.
+
+        Raises:
+            TraceNotFoundException: If no trace is found for message ID.
+        """
+        lock, users = self._trace_locks.get(message_id, (asyncio.Lock(), 0))
+        self._trace_locks[message_id] = (lock, users + 1)
+        try:
+            async with lock:
+                cached = self._trace_cache.get(message_id)
+                if (
+                    cached
+                    and time.monotonic() - cached[0]
+                    < ChainlitFeedbackService.TRACE_CACHE_TTL
+                ):
+                    self._trace_cache.move_to_end(message_id)
+                    return cached[1]
+
+                trace = await asyncio.to_thread(self._fetch_trace, message_id)
+                self._trace_cache[message_id] = (time.monotonic(), trace)
+                self._trace_cache.move_to_end(message_id)
+                if (
+                    len(self._trace_cache)
+                    > ChainlitFeedbackService.TRACE_CACHE_SIZE
+                ):
+                    self._trace_cache.popitem(last=False)
+                return trace
+        finally:
+            lock, users = self._trace_locks[message_id]
+            if users == 1:
+                del self._trace_locks[message_id]
+            else:
+                self._trace_locks[message_id] = (lock, users - 1)
+
     def _fetch_trace(self, message_id: str) -> TraceWithDetails:
         """Fetch trace by message ID.
 
@@ -107,24 +176,33 @@ class ChainlitFeedbackService:
             TraceNotFoundException: If no trace is found for message ID.
         """
         response = self.langfuse_client.fetch_traces(
-            tags=[self.chainlit_tag_format.format(message_id=message_id)]
+            tags=[f"{self._tag_prefix}{message_id}{self._tag_suffix}"],
+            limit=1,
         )
         trace = response.data[0] if response.data else None
         if trace is None:
             raise TraceNotFoundException(message_id)
         return trace
 
-    def _upload_trace_to_dataset(self, trace: TraceWithDetails) -> None:
+    async def _upload_trace_to_dataset(self, trace: TraceWithDetails) -> None:
         """Upload trace details to feedback dataset.
 
+        Retrieve and templating observations are fetched concurrently. Blocking Langfuse
+        calls run in worker threads, so they do not stall the event loop.
+
         Args:
             trace: Trace object containing interaction details.
         """
-        retrieve_observation = self._fetch_last_retrieve_observation(trace)
-        last_templating_observation = self._fetch_last_templating_observation(
-            trace
+        retrieve_observation, last_templating_observation = (
+            await asyncio.gather(
+                asyncio.to_thread(self._fetch_last_retrieve_observation, trace),
+                asyncio.to_thread(
+                    self._fetch_last_templating_observation, trace
+                ),
+            )
         )
-        self.langfuse_client.create_dataset_item(
+        await asyncio.to_thread(
+            self.langfuse_client.create_dataset_item,
             dataset_name=self.feedback_dataset.name,
             input={
                 "query_str": trace.input,
@@ -151,11 +229,7 @@ class ChainlitFeedbackService:
         Returns:
             ObservationsView: Latest retrieve observation sorted by creation time.
         """
-        retrieve_observations = self.langfuse_client.fetch_observations(
-            trace_id=trace.id,
-            name="retrieve",
-        )
-        return max(retrieve_observations.data, key=lambda x: x.createdAt)
+        return self._fetch_last_observation(trace, name="retrieve")
 
     def _fetch_last_templating_observation(
         self, trace: TraceWithDetails
@@ -168,11 +242,30 @@ class ChainlitFeedbackService:
         Returns:
             ObservationsView: Latest templating observation sorted by creation time.
         """
-        templating_observations = self.langfuse_client.fetch_observations(
+        return self._fetch_last_observation(trace, name="templating")
+
+    def _fetch_last_observation(
+        self, trace: TraceWithDetails, name: str
+    ) -> ObservationsView:
+        """Fetch most recent observation with given name for trace.
+
+        Args:
+            trace: Trace object containing observations.
+            name: Name of the observation.
+
+        Returns:
+            ObservationsView: Latest observation with given name.
+
+        Raises:
+            ObservationNotFoundException: If trace has no observation with given name.
+        """
+        observations = self.langfuse_client.fetch_observations(
             trace_id=trace.id,
-            name="templating",
+            name=name,
         )
-        return max(templating_observations.data, key=lambda x: x.createdAt)
+        if not observations.data:
+            raise ObservationNotFoundException(trace.id, name)
+        return max(observations.data, key=lambda x: x.createdAt)
 
     @staticmethod
     def _is_positive(feedback: Feedback) -> bool:
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 from chainlit import Message
 from llama_index.core.base.response.schema import StreamingResponse
@@ -12,11 +12,9 @@ class ConversationUtils:
 
     Attributes:
         WELCOME_TEMPLATE: Template string for welcome message.
-        REFERENCES_TEMPLATE: Template string for formatting references section.
     """
 
     WELCOME_TEMPLATE = "Welcome"
-    REFERENCES_TEMPLATE = "\n\n**References**:\n" "{references}\n"
 
     @staticmethod
     def get_welcome_message() -> Message:
@@ -37,45 +35,69 @@ class ConversationUtils:
             message: Message object to append references to.
             response: StreamingResponse containing source nodes.
         """
-        message.content += ConversationUtils._get_references_str(
-            response.source_nodes
+        message.content = "".join(
+            [
+                message.content,
+                ConversationUtils._get_references_str(response.source_nodes),
+            ]
         )
 
     @staticmethod
     def _get_references_str(nodes: List[NodeWithScore]) -> str:
         """Generate formatted references string from source nodes.
 
+        Nodes are first deduplicated by their source document ID, then the remaining
+        references by title and URL, keeping the order in which the nodes were retrieved.
+
         Args:
             nodes: List of source nodes with relevance scores.
 
         Returns:
             str: Formatted string of unique references.
         """
-        raw_references = [
-            ConversationUtils._get_reference_str(node) for node in nodes
-        ]
-        references = "\n".join(set(raw_references))
-        return ConversationUtils.REFERENCES_TEMPLATE.format(
-            references=references
+        unique_nodes = {}
+        for node in nodes:
+            unique_nodes.setdefault(
+                node.node.ref_doc_id or node.node.node_id, node
+            )
+        unique_references = dict.fromkeys(
+            ConversationUtils._get_reference_key(node)
+            for node in unique_nodes.values()
+        )
+        references = "\n".join(
+            ConversationUtils._get_reference_str(title, url)
+            for title, url in unique_references
         )
+        return f"\n\n**References**:\n{references}\n"
 
     @staticmethod
-    def _get_reference_str(node: NodeWithScore) -> str:
-        """Format a single node's reference as a string.
+    def _get_reference_key(node: NodeWithScore) -> Tuple[str, Optional[str]]:
+        """Get the title and URL identifying a node's reference.
 
         Args:
             node: Source node with metadata containing title and optional URL.
 
         Returns:
-            str: Formatted reference string, with URL link if available.
+            Tuple[str, Optional[str]]: Title and URL of the reference.
         """
         title = node.metadata.get("title")
         if not title:
             title = node.metadata.get("Title")
 
-        url = node.metadata.get("url")
+        return title, node.metadata.get("url")
+
+    @staticmethod
+    def _get_reference_str(title: str, url: Optional[str]) -> str:
+        """Format a single reference as a string.
+
+        Args:
+            title: Title of the referenced source.
+            url: Optional URL of the referenced source.
 
+        Returns:
+            str: Formatted reference string, with URL link if available.
+        """
         if url:
-            return "- [{}]({})".format(title, url)
+            return f"- [{title}]({url})"
         else:
             return f"- {title}"
@@ -6,6 +6,12 @@ To run the script execute the following command from the root directory of the p
 > python src/chat.py
 """
 
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import chainlit as cl
 from chainlit.cli import run_chainlit
 from llama_index.core.base.base_query_engine import BaseQueryEngine
@@ -13,6 +19,12 @@ from llama_index.core.base.base_query_engine import BaseQueryEngine
 from augmentation.utils import ConversationUtils
 from common.bootstrap.initializer import AugmentationInitializer
 
+QUERY_ENGINE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("QE_WORKERS", "8"))
+)
+STREAM_BATCH_SIZE = 16
+STREAM_BATCH_INTERVAL = 0.03
+
 
 @cl.cache
 def cached_injector() -> AugmentationInitializer:
@@ -39,16 +51,32 @@ async def main(user_message: cl.Message):
         user_message: Message received from user
 
     Note:
-        Streams tokens for real-time response generation
+        Streams tokens for real-time response generation in small batches
         Adds source references to responses
     """
     query_engine = cl.user_session.get("query_engine")
     assistant_message = cl.Message(content="", author="Assistant")
-    response = await cl.make_async(query_engine.query)(
-        user_message.content, assistant_message.parent_id
+    context = contextvars.copy_context()
+    response = await asyncio.get_running_loop().run_in_executor(
+        QUERY_ENGINE_EXECUTOR,
+        context.run,
+        query_engine.query,
+        user_message.content,
+        assistant_message.parent_id,
     )
+    tokens = []
+    last_flush_time = time.monotonic()
     for token in response.response_gen:
-        await assistant_message.stream_token(token)
+        tokens.append(token)
+        if (
+            len(tokens) >= STREAM_BATCH_SIZE
+            or time.monotonic() - last_flush_time >= STREAM_BATCH_INTERVAL
+        ):
+            await assistant_message.stream_token("".join(tokens))
+            tokens.clear()
+            last_flush_time = time.monotonic()
+    if tokens:
+        await assistant_message.stream_token("".join(tokens))
     # await cl.Message(author="Assistant", content=response.source_nodes).send()
     ConversationUtils.add_references(assistant_message, response)
     await assistant_message.send()
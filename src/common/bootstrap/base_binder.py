@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Type
 
 from injector import Binder
 from pydantic import BaseModel
@@ -34,6 +34,9 @@ class BaseBinder(ABC):
         """
         self.configuration = configuration
         self.binder = binder
+        self._fingerprints: Dict[
+            int, Tuple[BaseModel, Tuple[Type[BaseModel], str]]
+        ] = {}
 
     @abstractmethod
     def bind(self) -> None:
@@ -60,4 +63,23 @@ class BaseBinder(ABC):
 
         Returns:
             bool: True if the objects are equal, False otherwise"""
-        return a.model_dump() == b.model_dump()
+        if a is b:
+            return True
+        return self._get_fingerprint(a) == self._get_fingerprint(b)
+
+    def _get_fingerprint(self, model: BaseModel) -> Tuple[Type[BaseModel], str]:
+        """Get the fingerprint of the Pydantic configuration object.
+
+        The fingerprint is the model type with its JSON dump. Fingerprints are memoized per object, so each configuration is serialized at most once per binder.
+
+        Args:
+            model: Pydantic configuration object
+
+        Returns:
+            Tuple[Type[BaseModel], str]: Configuration fingerprint"""
+        if id(model) not in self._fingerprints:
+            self._fingerprints[id(model)] = (
+                model,
+                (type(model), model.model_dump_json()),
+            )
+        return self._fingerprints[id(model)][1]
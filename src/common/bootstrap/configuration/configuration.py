@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.bootstrap.configuration.metadata.metadata_configuration import (
     ConfigurationMetadata,
@@ -9,6 +9,8 @@ from common.bootstrap.configuration.pipeline.pipeline_configuration import (
 
 
 class Configuration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     metadata: ConfigurationMetadata = Field(
         ..., description="The metadata of the configuration."
     )
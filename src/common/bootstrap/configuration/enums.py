@@ -0,0 +1,12 @@
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    from enum import Enum
+
+    class StrEnum(str, Enum):
+        """Backport of `enum.StrEnum` for Python < 3.11."""
+
+        __hash__ = str.__hash__
+
+        def __str__(self) -> str:
+            return str(self.value)
@@ -1,10 +1,11 @@
-from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.bootstrap.configuration.enums import StrEnum
 
-class LogLevelName(str, Enum):
+
+class LogLevelName(StrEnum):
     DEBUG = "debug"
     INFO = "info"
     WARNING = "warning"
@@ -12,7 +13,7 @@ class LogLevelName(str, Enum):
     CRITICAL = "critical"
 
 
-class EnvironmentName(str, Enum):
+class EnvironmentName(StrEnum):
     DEFAULT = "default"
     LOCAL = "local"
     DEV = "dev"
@@ -21,6 +22,8 @@ class EnvironmentName(str, Enum):
 
 
 class ConfigurationMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     build_name: Optional[str] = Field(
         None,
         description="The name of the build.",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.bootstrap.configuration.pipeline.augmentation.chainlit.chainlit_configuration import (
     ChainlitConfiguration,
@@ -12,6 +12,8 @@ from common.bootstrap.configuration.pipeline.augmentation.query_engine.query_eng
 
 
 class AugmentationConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     query_engine: QueryEngineConfiguration = Field(
         ...,
         description="The query engine configuration for the augmentation pipeline.",
@@ -1,3 +1,5 @@
+from injector import singleton
+
 from augmentation.chainlit.builders import (
     ChainlitFeedbackServiceBuilder,
     ChainlitServiceBuilder,
@@ -20,6 +22,7 @@ class ChainlitBinder(BaseBinder):
         self.binder.bind(
             ChainlitFeedbackService,
             to=ChainlitFeedbackServiceBuilder.build,
+            scope=singleton,
         )
 
     def _bind_service(self) -> None:
@@ -27,4 +30,5 @@ class ChainlitBinder(BaseBinder):
         self.binder.bind(
             ChainlitService,
             to=ChainlitServiceBuilder.build,
+            scope=singleton,
         )
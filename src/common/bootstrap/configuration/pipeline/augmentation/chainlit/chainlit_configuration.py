@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChainlitConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     port: int = Field(8000, description="Port to run the chainlit service on.")
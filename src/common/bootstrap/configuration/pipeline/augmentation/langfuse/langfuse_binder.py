@@ -31,9 +31,12 @@ class LangfuseBinder(BaseBinder):
 
     def _bind_configuration(self) -> None:
         """Bind the Langfuse configuration."""
+        langfuse_configuration = (
+            self.configuration.pipeline.augmentation.langfuse
+        )
         self.binder.bind(
             LangfuseConfiguration,
-            to=lambda: self.configuration.pipeline.augmentation.langfuse,
+            to=lambda: langfuse_configuration,
             scope=singleton,
         )
 
@@ -61,13 +64,16 @@ class LangfuseBinder(BaseBinder):
 
     def _bind_datasets(self) -> None:
         """Bind the Langfuse datasets."""
+        datasets_configuration = (
+            self.configuration.pipeline.augmentation.langfuse.datasets
+        )
         self.binder.bind(
             BoundFeedbackDatasetConfiguration,
-            to=lambda: self.configuration.pipeline.augmentation.langfuse.datasets.feedback_dataset,
+            to=lambda: datasets_configuration.feedback_dataset,
             scope=singleton,
         )
         self.binder.bind(
             BoundManualDatasetConfiguration,
-            to=lambda: self.configuration.pipeline.augmentation.langfuse.datasets.manual_dataset,
+            to=lambda: datasets_configuration.manual_dataset,
             scope=singleton,
         )
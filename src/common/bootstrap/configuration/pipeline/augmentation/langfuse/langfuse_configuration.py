@@ -1,13 +1,30 @@
-from typing import Literal, Union
+from functools import cached_property
+from typing import ClassVar, Literal, Tuple, Type, Union
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
-from pydantic_settings import BaseSettings
 
-from common.bootstrap.secrets_configuration import ConfigurationWithSecrets
+from common.bootstrap.secrets_configuration import (
+    BaseSecrets,
+    ConfigurationWithSecrets,
+)
+
+
+def split_chainlit_tag_format(chainlit_tag_format: str) -> Tuple[str, str]:
+    """
+    Split the chainlit tag format around its `{message_id}` field, so tags can be built by concatenation instead of `str.format` per message.
+
+    Args:
+        chainlit_tag_format (str): Format of the tag with a `{message_id}` field.
+
+    Returns:
+        Tuple[str, str]: The parts of the tag before and after the message id.
+    """
+    prefix, suffix = chainlit_tag_format.format(message_id="\0").split("\0", 1)
+    return prefix, suffix
 
 
 # Secrets
-class LangfuseSecrets(BaseSettings):
+class LangfuseSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAG__LANGFUSE__",
@@ -23,7 +40,7 @@ class LangfuseSecrets(BaseSettings):
     )
 
 
-class LangfuseDatabaseSecrets(BaseSettings):
+class LangfuseDatabaseSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAG__LANGFUSE__DATABASE__",
@@ -41,6 +58,8 @@ class LangfuseDatabaseSecrets(BaseSettings):
 
 # Configuration
 class LangfuseDatabaseConfiguration(ConfigurationWithSecrets):
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(
         "127.0.0.1", description="Host of the Langfuse database server"
     )
@@ -52,12 +71,12 @@ class LangfuseDatabaseConfiguration(ConfigurationWithSecrets):
         "langfuse",
         description="Name of the langfuse database server's database.",
     )
-    secrets: LangfuseDatabaseSecrets = Field(
-        None, description="The secrets for the langfuse database."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = LangfuseDatabaseSecrets
 
 
 class LangfuseDatasetConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         ...,
         description="Name of the dataset in the Langfuse server",
@@ -72,15 +91,17 @@ class LangfuseDatasetConfiguration(BaseModel):
 
 
 class LangfuseDatasetsConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     feedback_dataset: LangfuseDatasetConfiguration = Field(
-        LangfuseDatasetConfiguration(
+        default_factory=lambda: LangfuseDatasetConfiguration.model_construct(
             name="feedback-dataset",
             description="Dataset created out of positive feedbacks from the chatbot",
         ),
         description="Feedback dataset in the Langfuse server",
     )
     manual_dataset: LangfuseDatasetConfiguration = Field(
-        LangfuseDatasetConfiguration(
+        default_factory=lambda: LangfuseDatasetConfiguration.model_construct(
             name="manual-dataset",
             description="Dataset created directly by the user indicating the query and the correct answer",
         ),
@@ -89,6 +110,8 @@ class LangfuseDatasetsConfiguration(BaseModel):
 
 
 class LangfuseConfiguration(ConfigurationWithSecrets):
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field("127.0.0.1", description="Host of the Langfuse server")
     protocol: Union[Literal["http"], Literal["https"]] = Field(
         "http", description="The protocol for the vector store."
@@ -106,10 +129,8 @@ class LangfuseConfiguration(ConfigurationWithSecrets):
         "chainlit_message_id: {message_id}",
         description="Format of the tag used to retrieve the trace by chainlit message id in langfuse",
     )
-    secrets: LangfuseSecrets = Field(
-        None, description="The secrets for the Langfuse."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = LangfuseSecrets
 
-    @property
+    @cached_property
     def url(self) -> str:
         return f"{self.protocol}://{self.host}:{self.port}"
@@ -1,26 +1,23 @@
-from enum import Enum
-from typing import Callable, Literal, Optional, Union
+from typing import Annotated, Callable, ClassVar, Literal, Optional, Type, Union
 
 from pydantic import ConfigDict, Field, SecretStr
-from pydantic_settings import BaseSettings
 
-from common.bootstrap.secrets_configuration import ConfigurationWithSecrets
+from common.bootstrap.configuration.enums import StrEnum
+from common.bootstrap.secrets_configuration import (
+    BaseSecrets,
+    ConfigurationWithSecrets,
+)
 from common.builders.llm_builders import OpenAIBuilder, OpenAILikeBuilder
 
 
 # Enums
-class OpenAILikeLLMNames(str, Enum):
-    NEMO = "nemo"
-    LLAMA = "llama"
-
-
-class LLMProviderNames(str, Enum):
+class LLMProviderNames(StrEnum):
     OPENAI = "openai"
     OPENAI_LIKE = "openai-like"
 
 
 # Secrets
-class OpenAILLMSecrets(BaseSettings):
+class OpenAILLMSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAG__LLMS__OPENAI__",
@@ -50,6 +47,8 @@ class OpenAILikeLLMSecrets(OpenAILLMSecrets):
 
 
 class LLMConfiguration(ConfigurationWithSecrets):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="The name of the language model.")
     max_tokens: int = Field(
         ..., description="The maximum number of tokens for the language model."
@@ -64,9 +63,7 @@ class OpenAILLMConfiguration(LLMConfiguration):
     provider: Literal[LLMProviderNames.OPENAI] = Field(
         ..., description="The name of the language model provider."
     )
-    secrets: OpenAILLMSecrets = Field(
-        None, description="The secrets for the language model."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = OpenAILLMSecrets
 
     builder: Callable = Field(
         OpenAIBuilder.build,
@@ -79,12 +76,10 @@ class OpenAILikeLLMConfiguration(LLMConfiguration):
     provider: Literal[LLMProviderNames.OPENAI_LIKE] = Field(
         ..., description="The name of the language model provider."
     )
-    name: Literal[OpenAILikeLLMNames.LLAMA, OpenAILikeLLMNames.NEMO] = Field(
+    name: Literal["llama", "nemo"] = Field(
         ..., description="The name of the language model."
     )
-    secrets: OpenAILikeLLMSecrets = Field(
-        None, description="The secrets for the language model."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = OpenAILikeLLMSecrets
     context_window: int = Field(
         ..., description="The context window size for the language model."
     )
@@ -96,4 +91,7 @@ class OpenAILikeLLMConfiguration(LLMConfiguration):
     )
 
 
-AVAILABLE_LLMS = Union[OpenAILikeLLMConfiguration, OpenAILLMConfiguration]
+AVAILABLE_LLMS = Annotated[
+    Union[OpenAILikeLLMConfiguration, OpenAILLMConfiguration],
+    Field(discriminator="provider"),
+]
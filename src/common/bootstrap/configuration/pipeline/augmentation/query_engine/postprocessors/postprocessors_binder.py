@@ -1,7 +1,7 @@
+from types import MappingProxyType
 from typing import Type
 
-from injector import Binder, singleton
-from llama_index.postprocessor.colbert_rerank import ColbertRerank
+from injector import Binder, InstanceProvider, singleton
 
 from common.bootstrap.base_binder import BaseBinder
 from common.bootstrap.configuration.pipeline.augmentation.query_engine.postprocessors.postprocessors_binding_key import (
@@ -26,8 +26,7 @@ class ColbertRerankBinder(BaseBinder):
             configuration: Colbert rerank configuration
             binder: Injector binder
         """
-        self.configuration = configuration
-        self.binder = binder
+        super().__init__(configuration=configuration, binder=binder)
 
     def bind(self) -> Type:
         """Bind components to the injector based on the configuration.
@@ -35,8 +34,7 @@ class ColbertRerankBinder(BaseBinder):
         Returns:
             Type: Colbert rerank postprocessor class"""
         self._bind_configuration()
-        self._bind_postprocessor()
-        return ColbertRerank
+        return self._bind_postprocessor()
 
     def _bind_configuration(self) -> None:
         """Bind the Colbert rerank configuration."""
@@ -46,20 +44,29 @@ class ColbertRerankBinder(BaseBinder):
             scope=singleton,
         )
 
-    def _bind_postprocessor(self) -> None:
-        """Bind the Colbert rerank postprocessor."""
+    def _bind_postprocessor(self) -> Type:
+        """Bind the Colbert rerank postprocessor.
+
+        Returns:
+            Type: Colbert rerank postprocessor class"""
+        # Imported on demand, the reranker pulls in torch and transformers
+        from llama_index.postprocessor.colbert_rerank import ColbertRerank
+
         self.binder.bind(
             ColbertRerank,
             to=ColbertRerankBuilder.build,
         )
+        return ColbertRerank
 
 
 class PostprocessorsBinder(BaseBinder):
     """Binder for the postprocessors."""
 
-    mapping = {
-        PostProcessorName.COLBERT_RERANK: ColbertRerankBinder,
-    }
+    mapping = MappingProxyType(
+        {
+            PostProcessorName.COLBERT_RERANK: ColbertRerankBinder,
+        }
+    )
 
     def bind(self) -> None:
         """Bind components to the injector based on the configuration.
@@ -68,17 +75,15 @@ class PostprocessorsBinder(BaseBinder):
         postprocessors_configuration = (
             self.configuration.pipeline.augmentation.query_engine.postprocessors
         )
-        postprocessors = []
-
-        for postprocessor_configuration in postprocessors_configuration:
-            postprocessor_name = postprocessor_configuration.name
-            postprocessor_binder = self.mapping[postprocessor_name](
-                postprocessor_configuration, self.binder
-            )
-            postprocessor_key = postprocessor_binder.bind()
-            postprocessors.append(self._get_bind(postprocessor_key)())
+        mapping, binder, get_bind = self.mapping, self.binder, self._get_bind
+        postprocessors = tuple(
+            get_bind(
+                mapping[configuration.name](configuration, binder).bind()
+            )()
+            for configuration in postprocessors_configuration
+        )
 
         self.binder.bind(
             BoundPostprocessors,
-            to=lambda: postprocessors,
+            to=InstanceProvider(postprocessors),
         )
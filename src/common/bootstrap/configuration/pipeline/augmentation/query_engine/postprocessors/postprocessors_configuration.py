@@ -1,16 +1,20 @@
 from enum import Enum
 from typing import Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from common.bootstrap.configuration.enums import StrEnum
 
 
 # Enums
-class PostProcessorName(str, Enum):
+class PostProcessorName(StrEnum):
     COLBERT_RERANK = "colbert_reranker"
 
 
 # Configuration
 class PostProcessorConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: PostProcessorName = Field(
         ..., description="The name of the postprocessor."
     )
@@ -23,7 +27,7 @@ class ColbertRerankConfiguration(PostProcessorConfiguration):
     class Tokenizers(str, Enum):
         COLBERTV2 = "colbert-ir/colbertv2.0"
 
-    name: Literal[PostProcessorName.COLBERT_RERANK] = Field(
+    name: Literal["colbert_reranker"] = Field(
         ..., description="The name of the postprocessor."
     )
     model: Models = Field(
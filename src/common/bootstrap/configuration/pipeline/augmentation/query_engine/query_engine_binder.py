@@ -18,17 +18,18 @@ from common.builders.query_engine_builders import QueryEngineBuilder
 class QueryEngineBinder(BaseBinder):
     """Binder for the query engine components."""
 
+    component_binders = (
+        RetrieverBinder,
+        SynthezierBinder,
+        PostprocessorsBinder,
+    )
+
     def bind(self) -> None:
         """Bind components to the injector based on the configuration."""
-        RetrieverBinder(
-            configuration=self.configuration, binder=self.binder
-        ).bind()
-        SynthezierBinder(
-            configuration=self.configuration, binder=self.binder
-        ).bind()
-        PostprocessorsBinder(
-            configuration=self.configuration, binder=self.binder
-        ).bind()
+        for component_binder in self.component_binders:
+            component_binder(
+                configuration=self.configuration, binder=self.binder
+            ).bind()
         self._bind_callback_manager()
         self._bind_query_engine()
 
@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.bootstrap.configuration.pipeline.augmentation.query_engine.postprocessors.postprocessors_configuration import (
     AVAILABLE_POSTPROCESSORS,
@@ -14,6 +14,8 @@ from common.bootstrap.configuration.pipeline.augmentation.query_engine.synthesiz
 
 
 class QueryEngineConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     retriever: AVAILABLE_RETRIEVERS = Field(
         ...,
         description="The retriever configuration for the augmentation pipeline.",
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from injector import singleton
 from llama_index.core.base.base_retriever import BaseRetriever
 
@@ -66,11 +68,12 @@ class AutoRetrieverBinder(BaseBinder):
         If the LLM configuration for the synthesizer and retriever are the same, bind the same LLM instance to both.
         Otherwise, bind separate LLM instances to the synthesizer and retriever.
         """
-        llm_configuration = (
-            self.configuration.pipeline.augmentation.query_engine.synthesizer.llm
+        query_engine_configuration = (
+            self.configuration.pipeline.augmentation.query_engine
         )
+        llm_configuration = query_engine_configuration.synthesizer.llm
         auto_retriever_llm_configuration = (
-            self.configuration.pipeline.augmentation.query_engine.retriever.llm
+            query_engine_configuration.retriever.llm
         )
 
         if self._pydantic_config_is_equal(
@@ -101,10 +104,12 @@ class AutoRetrieverBinder(BaseBinder):
 class RetrieverBinder(BaseBinder):
     """Binder for the retriever components."""
 
-    mapping = {
-        RetrieverName.BASIC: BasicRetrieverBinder,
-        RetrieverName.AUTO_RETRIEVER: AutoRetrieverBinder,
-    }
+    mapping = MappingProxyType(
+        {
+            RetrieverName.BASIC: BasicRetrieverBinder,
+            RetrieverName.AUTO_RETRIEVER: AutoRetrieverBinder,
+        }
+    )
 
     def bind(self) -> None:
         """Binds specific retriever based on the configuration."""
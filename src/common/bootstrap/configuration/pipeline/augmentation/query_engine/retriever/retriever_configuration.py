@@ -1,21 +1,23 @@
-from enum import Enum
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.bootstrap.configuration.enums import StrEnum
 from common.bootstrap.configuration.pipeline.augmentation.query_engine.llm_configuration import (
     AVAILABLE_LLMS,
 )
 
 
 # Enums
-class RetrieverName(str, Enum):
+class RetrieverName(StrEnum):
     BASIC = "basic"
     AUTO_RETRIEVER = "auto_retriever"
 
 
 # Configuration
 class RetrieverConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: RetrieverName = Field(..., description="The name of the retriever.")
     similarity_top_k: int = Field(
         ..., description="The number of top similar items to retrieve."
@@ -23,13 +25,13 @@ class RetrieverConfiguration(BaseModel):
 
 
 class BasicRetrieverConfiguration(RetrieverConfiguration):
-    name: Literal[RetrieverName.BASIC] = Field(
+    name: Literal["basic"] = Field(
         ..., description="The name of the retriever."
     )
 
 
 class AutoRetrieverConfiguration(RetrieverConfiguration):
-    name: Literal[RetrieverName.AUTO_RETRIEVER] = Field(
+    name: Literal["auto_retriever"] = Field(
         ..., description="The name of the retriever."
     )
     llm: AVAILABLE_LLMS = Field(
@@ -38,6 +40,7 @@ class AutoRetrieverConfiguration(RetrieverConfiguration):
     )
 
 
-AVAILABLE_RETRIEVERS = Union[
-    BasicRetrieverConfiguration, AutoRetrieverConfiguration
+AVAILABLE_RETRIEVERS = Annotated[
+    Union[BasicRetrieverConfiguration, AutoRetrieverConfiguration],
+    Field(discriminator="name"),
 ]
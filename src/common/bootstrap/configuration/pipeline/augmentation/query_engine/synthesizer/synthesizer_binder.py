@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from injector import singleton
 from llama_index.core.response_synthesizers import BaseSynthesizer
 
@@ -53,9 +55,11 @@ class TreeSynthesizerBinder(BaseBinder):
 class SynthezierBinder(BaseBinder):
     """Binder for the synthesizer component."""
 
-    mapping = {
-        SynthesizerName.TREE: TreeSynthesizerBinder,
-    }
+    mapping = MappingProxyType(
+        {
+            SynthesizerName.TREE: TreeSynthesizerBinder,
+        }
+    )
 
     def bind(self) -> None:
         """Bind specific synthesizer component to the injector based on the configuration."""
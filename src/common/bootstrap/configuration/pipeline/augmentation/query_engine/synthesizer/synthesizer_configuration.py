@@ -1,20 +1,22 @@
-from enum import Enum
 from typing import Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.bootstrap.configuration.enums import StrEnum
 from common.bootstrap.configuration.pipeline.augmentation.query_engine.llm_configuration import (
     AVAILABLE_LLMS,
 )
 
 
 # Enums
-class SynthesizerName(str, Enum):
+class SynthesizerName(StrEnum):
     TREE = "tree"
 
 
 # Configuraiton
 class SynthesizerConfiguration(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: SynthesizerName = Field(
         ..., description="The name of the synthesizer."
     )
@@ -30,7 +32,7 @@ class SynthesizerConfiguration(BaseModel):
 
 
 class TreeSynthesizerConfiguration(SynthesizerConfiguration):
-    name: Literal[SynthesizerName.TREE] = Field(
+    name: Literal["tree"] = Field(
         ..., description="The name of the synthesizer."
     )
     response_mode: str = Field(
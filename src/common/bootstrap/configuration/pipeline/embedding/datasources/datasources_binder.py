@@ -1,8 +1,7 @@
+from types import MappingProxyType
 from typing import Type
 
-from atlassian import Confluence
-from injector import singleton
-from notion_client import Client
+from injector import Binder, singleton
 
 from common.bootstrap.base_binder import BaseBinder
 from common.bootstrap.configuration.pipeline.embedding.datasources.datasources_binding_keys import (
@@ -15,44 +14,6 @@ from common.bootstrap.configuration.pipeline.embedding.datasources.datasources_c
     NotionDatasourceConfiguration,
     PdfDatasourceConfiguration,
 )
-from embedding.datasources.confluence.builders import (
-    ConfluenceCleanerBuilder,
-    ConfluenceClientBuilder,
-    ConfluenceDatasourceManagerBuilder,
-    ConfluenceReaderBuilder,
-    ConfluenceSplitterBuilder,
-)
-from embedding.datasources.confluence.cleaner import ConfluenceCleaner
-from embedding.datasources.confluence.manager import ConfluenceDatasourceManager
-from embedding.datasources.confluence.reader import ConfluenceReader
-from embedding.datasources.confluence.splitter import ConfluenceSplitter
-from embedding.datasources.hackernews.builders import (
-    HackernewsCleanerBuilder,
-    HackernewsDatasourceManagerBuilder,
-    HackernewsReaderBuilder,
-)
-from embedding.datasources.hackernews.cleaner import HackernewsCleaner
-from embedding.datasources.hackernews.manager import HackernewsDatasourceManager
-from embedding.datasources.hackernews.reader import HackernewsReader
-from embedding.datasources.notion.builders import (
-    NotionCleanerBuilder,
-    NotionClientBuilder,
-    NotionDatasourceManagerBuilder,
-    NotionExporterBuilder,
-    NotionReaderBuilder,
-    NotionSplitterBuilder,
-)
-from embedding.datasources.notion.cleaner import NotionCleaner
-from embedding.datasources.notion.exporter import NotionExporter
-from embedding.datasources.notion.manager import NotionDatasourceManager
-from embedding.datasources.notion.reader import NotionReader
-from embedding.datasources.notion.splitter import NotionSplitter
-from embedding.datasources.pdf.builders import (
-    PdfDatasourceManagerBuilder,
-    PdfReaderBuilder,
-)
-from embedding.datasources.pdf.manager import PdfDatasourceManager
-from embedding.datasources.pdf.reader import PdfReader
 from embedding.embedders.builders import EmbedderBuilder
 from embedding.embedders.default_embedder import Embedder
 from embedding.orchestrators.builders import DatasourceOrchestratorBuilder
@@ -64,11 +25,24 @@ from embedding.orchestrators.datasource_orchestrator import (
 class NotionDatasourceBinder(BaseBinder):
     """Binder for the Notion datasources components."""
 
+    def __init__(
+        self, configuration: NotionDatasourceConfiguration, binder: Binder
+    ):
+        """Initialize the Notion datasource binder.
+
+        Args:
+            configuration: Notion datasource configuration
+            binder: Injector binder
+        """
+        super().__init__(configuration=configuration, binder=binder)
+
     def bind(self) -> Type:
         """Bind the Notion datasources components.
 
         Returns:
             Type: The Notion datasource manager."""
+        from embedding.datasources.notion.manager import NotionDatasourceManager
+
         self._bind_notion_cofuguration()
         self._bind_exporter()
         self._bind_client()
@@ -80,19 +54,17 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_notion_cofuguration(self) -> None:
         """Bind the Notion datasource configuration."""
-        notion_configuration = [
-            configuration
-            for configuration in self.configuration.pipeline.embedding.datasources
-            if isinstance(configuration, NotionDatasourceConfiguration)
-        ][0]
         self.binder.bind(
             NotionDatasourceConfiguration,
-            to=notion_configuration,
+            to=self.configuration,
             scope=singleton,
         )
 
     def _bind_exporter(self) -> None:
         """Bind the Notion exporter."""
+        from embedding.datasources.notion.builders import NotionExporterBuilder
+        from embedding.datasources.notion.exporter import NotionExporter
+
         self.binder.bind(
             NotionExporter,
             to=NotionExporterBuilder.build,
@@ -100,6 +72,10 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_client(self) -> None:
         """Bind the Notion client."""
+        from notion_client import Client
+
+        from embedding.datasources.notion.builders import NotionClientBuilder
+
         self.binder.bind(
             Client,
             to=NotionClientBuilder.build,
@@ -107,6 +83,9 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_reader(self) -> None:
         """Bind the Notion reader."""
+        from embedding.datasources.notion.builders import NotionReaderBuilder
+        from embedding.datasources.notion.reader import NotionReader
+
         self.binder.bind(
             NotionReader,
             to=NotionReaderBuilder.build,
@@ -114,6 +93,9 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_cleaner(self) -> None:
         """Bind the Notion cleaner."""
+        from embedding.datasources.notion.builders import NotionCleanerBuilder
+        from embedding.datasources.notion.cleaner import NotionCleaner
+
         self.binder.bind(
             NotionCleaner,
             to=NotionCleanerBuilder.build,
@@ -121,6 +103,9 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_splitter(self) -> None:
         """Bind the Notion splitter."""
+        from embedding.datasources.notion.builders import NotionSplitterBuilder
+        from embedding.datasources.notion.splitter import NotionSplitter
+
         self.binder.bind(
             NotionSplitter,
             to=NotionSplitterBuilder.build,
@@ -128,6 +113,11 @@ class NotionDatasourceBinder(BaseBinder):
 
     def _bind_manager(self) -> None:
         """Bind the Notion datasource manager."""
+        from embedding.datasources.notion.builders import (
+            NotionDatasourceManagerBuilder,
+        )
+        from embedding.datasources.notion.manager import NotionDatasourceManager
+
         self.binder.bind(
             NotionDatasourceManager,
             to=NotionDatasourceManagerBuilder.build,
@@ -137,11 +127,26 @@ class NotionDatasourceBinder(BaseBinder):
 class ConfluenceBinder(BaseBinder):
     """Binder for the Confluence datasources components."""
 
+    def __init__(
+        self, configuration: ConfluenceDatasourceConfiguration, binder: Binder
+    ):
+        """Initialize the Confluence datasource binder.
+
+        Args:
+            configuration: Confluence datasource configuration
+            binder: Injector binder
+        """
+        super().__init__(configuration=configuration, binder=binder)
+
     def bind(self) -> Type:
         """Bind the Confluence datasources components.
 
         Returns:
             Type: The Confluence datasource manager."""
+        from embedding.datasources.confluence.manager import (
+            ConfluenceDatasourceManager,
+        )
+
         self._bind_confluence_cofuguration()
         self._bind_client()
         self._bind_reader()
@@ -152,19 +157,20 @@ class ConfluenceBinder(BaseBinder):
 
     def _bind_confluence_cofuguration(self) -> None:
         """Bind the Confluence datasource configuration."""
-        confluence_configuration = [
-            configuration
-            for configuration in self.configuration.pipeline.embedding.datasources
-            if isinstance(configuration, ConfluenceDatasourceConfiguration)
-        ][0]
         self.binder.bind(
             ConfluenceDatasourceConfiguration,
-            to=confluence_configuration,
+            to=self.configuration,
             scope=singleton,
         )
 
     def _bind_client(self) -> None:
         """Bind the Confluence client."""
+        from atlassian import Confluence
+
+        from embedding.datasources.confluence.builders import (
+            ConfluenceClientBuilder,
+        )
+
         self.binder.bind(
             Confluence,
             to=ConfluenceClientBuilder.build,
@@ -172,6 +178,11 @@ class ConfluenceBinder(BaseBinder):
 
     def _bind_reader(self) -> None:
         """Bind the Confluence reader."""
+        from embedding.datasources.confluence.builders import (
+            ConfluenceReaderBuilder,
+        )
+        from embedding.datasources.confluence.reader import ConfluenceReader
+
         self.binder.bind(
             ConfluenceReader,
             to=ConfluenceReaderBuilder.build,
@@ -179,10 +190,20 @@ class ConfluenceBinder(BaseBinder):
 
     def _bind_cleaner(self) -> None:
         """Bind the Confluence cleaner."""
+        from embedding.datasources.confluence.builders import (
+            ConfluenceCleanerBuilder,
+        )
+        from embedding.datasources.confluence.cleaner import ConfluenceCleaner
+
         self.binder.bind(ConfluenceCleaner, to=ConfluenceCleanerBuilder.build)
 
     def _bind_splitter(self) -> None:
         """Bind the Confluence splitter."""
+        from embedding.datasources.confluence.builders import (
+            ConfluenceSplitterBuilder,
+        )
+        from embedding.datasources.confluence.splitter import ConfluenceSplitter
+
         self.binder.bind(
             ConfluenceSplitter,
             to=ConfluenceSplitterBuilder.build,
@@ -190,6 +211,13 @@ class ConfluenceBinder(BaseBinder):
 
     def _bind_manager(self) -> None:
         """Bind the Confluence datasource manager."""
+        from embedding.datasources.confluence.builders import (
+            ConfluenceDatasourceManagerBuilder,
+        )
+        from embedding.datasources.confluence.manager import (
+            ConfluenceDatasourceManager,
+        )
+
         self.binder.bind(
             ConfluenceDatasourceManager,
             to=ConfluenceDatasourceManagerBuilder.build,
@@ -199,11 +227,24 @@ class ConfluenceBinder(BaseBinder):
 class PdfDatasourcesBinder(BaseBinder):
     """Binder for the PDF datasources components."""
 
+    def __init__(
+        self, configuration: PdfDatasourceConfiguration, binder: Binder
+    ):
+        """Initialize the PDF datasource binder.
+
+        Args:
+            configuration: PDF datasource configuration
+            binder: Injector binder
+        """
+        super().__init__(configuration=configuration, binder=binder)
+
     def bind(self) -> Type:
         """Bind the PDF datasources components.
 
         Returns:
             Type: The PDF datasource manager."""
+        from embedding.datasources.pdf.manager import PdfDatasourceManager
+
         self._bind_pdf_configuration()
         self._bind_reader()
         self._bind_manager()
@@ -211,19 +252,17 @@ class PdfDatasourcesBinder(BaseBinder):
 
     def _bind_pdf_configuration(self) -> None:
         """Bind the PDF datasource configuration."""
-        confluence_configuration = [
-            configuration
-            for configuration in self.configuration.pipeline.embedding.datasources
-            if isinstance(configuration, PdfDatasourceConfiguration)
-        ][0]
         self.binder.bind(
             PdfDatasourceConfiguration,
-            to=confluence_configuration,
+            to=self.configuration,
             scope=singleton,
         )
 
     def _bind_reader(self) -> None:
         """Bind the PDF reader."""
+        from embedding.datasources.pdf.builders import PdfReaderBuilder
+        from embedding.datasources.pdf.reader import PdfReader
+
         self.binder.bind(
             PdfReader,
             to=PdfReaderBuilder.build,
@@ -231,6 +270,11 @@ class PdfDatasourcesBinder(BaseBinder):
 
     def _bind_manager(self) -> None:
         """Bind the PDF datasource manager."""
+        from embedding.datasources.pdf.builders import (
+            PdfDatasourceManagerBuilder,
+        )
+        from embedding.datasources.pdf.manager import PdfDatasourceManager
+
         self.binder.bind(
             PdfDatasourceManager,
             to=PdfDatasourceManagerBuilder.build,
@@ -240,11 +284,26 @@ class PdfDatasourcesBinder(BaseBinder):
 class HackernewsBinder(BaseBinder):
     """Binder for the Hacker News datasources components."""
 
+    def __init__(
+        self, configuration: HackernewsDatasourceConfiguration, binder: Binder
+    ):
+        """Initialize the Hacker News datasource binder.
+
+        Args:
+            configuration: Hacker News datasource configuration
+            binder: Injector binder
+        """
+        super().__init__(configuration=configuration, binder=binder)
+
     def bind(self) -> Type:
         """Bind the Hacker News datasources components.
 
         Returns:
             Type: The Hacker News datasource manager."""
+        from embedding.datasources.hackernews.manager import (
+            HackernewsDatasourceManager,
+        )
+
         self._bind_hackernews_configuration()
         self._bind_reader()
         self._bind_cleaner()
@@ -253,19 +312,19 @@ class HackernewsBinder(BaseBinder):
 
     def _bind_hackernews_configuration(self) -> None:
         """Bind the Hacker News datasource configuration."""
-        hackernews_configuration = [
-            configuration
-            for configuration in self.configuration.pipeline.embedding.datasources
-            if isinstance(configuration, HackernewsDatasourceConfiguration)
-        ][0]
         self.binder.bind(
             HackernewsDatasourceConfiguration,
-            to=hackernews_configuration,
+            to=self.configuration,
             scope=singleton,
         )
 
     def _bind_reader(self) -> None:
         """Bind the Hacker News reader."""
+        from embedding.datasources.hackernews.builders import (
+            HackernewsReaderBuilder,
+        )
+        from embedding.datasources.hackernews.reader import HackernewsReader
+
         self.binder.bind(
             HackernewsReader,
             to=HackernewsReaderBuilder.build,
@@ -273,10 +332,22 @@ class HackernewsBinder(BaseBinder):
 
     def _bind_cleaner(self) -> None:
         """Bind the Hacker News cleaner."""
+        from embedding.datasources.hackernews.builders import (
+            HackernewsCleanerBuilder,
+        )
+        from embedding.datasources.hackernews.cleaner import HackernewsCleaner
+
         self.binder.bind(HackernewsCleaner, to=HackernewsCleanerBuilder.build)
 
     def _bind_manager(self) -> None:
         """Bind the Hacker News datasource manager."""
+        from embedding.datasources.hackernews.builders import (
+            HackernewsDatasourceManagerBuilder,
+        )
+        from embedding.datasources.hackernews.manager import (
+            HackernewsDatasourceManager,
+        )
+
         self.binder.bind(
             HackernewsDatasourceManager,
             to=HackernewsDatasourceManagerBuilder.build,
@@ -288,12 +359,14 @@ class DatasourcesBinder(BaseBinder):
 
     Bind the list of datasource managers based on the configuration."""
 
-    mapping = {
-        DatasourceName.CONFLUENCE: ConfluenceBinder,
-        DatasourceName.NOTION: NotionDatasourceBinder,
-        DatasourceName.PDF: PdfDatasourcesBinder,
-        DatasourceName.HACKERNEWS: HackernewsBinder,
-    }
+    mapping = MappingProxyType(
+        {
+            DatasourceName.CONFLUENCE: ConfluenceBinder,
+            DatasourceName.NOTION: NotionDatasourceBinder,
+            DatasourceName.PDF: PdfDatasourcesBinder,
+            DatasourceName.HACKERNEWS: HackernewsBinder,
+        }
+    )
 
     def bind(self) -> None:
         self._bind_datasource_managers()
@@ -303,23 +376,25 @@ class DatasourcesBinder(BaseBinder):
     def _bind_datasource_managers(self) -> None:
         """Bind the datasource managers.
 
-        Bind the datasource managers based on the configuration."""
+        Bind the datasource managers based on the configuration. Managers are resolved when the datasource managers are first requested, not while binding.
+        """
         datasources_configuration = (
             self.configuration.pipeline.embedding.datasources
         )
-        datasources = {}
-
-        for datasource_configuration in datasources_configuration:
-            datasource_manager_key = DatasourcesBinder.mapping[
-                datasource_configuration.name
-            ](configuration=self.configuration, binder=self.binder).bind()
-            datasources[datasource_configuration.name] = self._get_bind(
-                datasource_manager_key
-            )()
+        mapping, binder, get_bind = self.mapping, self.binder, self._get_bind
+        datasource_manager_binds = {
+            configuration.name: get_bind(
+                mapping[configuration.name](configuration, binder).bind()
+            )
+            for configuration in datasources_configuration
+        }
 
         self.binder.bind(
             BoundDatasourceManagers,
-            to=lambda: datasources,
+            to=lambda: {
+                name: get_datasource_manager()
+                for name, get_datasource_manager in datasource_manager_binds.items()
+            },
             scope=singleton,
         )
 
@@ -1,11 +1,14 @@
 from abc import ABC
 from enum import Enum
-from typing import Literal, Optional, Union
+from functools import cached_property
+from typing import Annotated, ClassVar, Literal, Optional, Type, Union
 
 from pydantic import ConfigDict, Field, SecretStr
-from pydantic_settings import BaseSettings
 
-from common.bootstrap.secrets_configuration import ConfigurationWithSecrets
+from common.bootstrap.secrets_configuration import (
+    BaseSecrets,
+    ConfigurationWithSecrets,
+)
 
 # Enums
 
@@ -20,7 +23,7 @@ class DatasourceName(str, Enum):
 # Secrets
 
 
-class NotionSecrets(BaseSettings):
+class NotionSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAG__DATASOURCES__NOTION__",
@@ -33,7 +36,7 @@ class NotionSecrets(BaseSettings):
     )
 
 
-class ConfluenceSecrets(BaseSettings):
+class ConfluenceSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAG__DATASOURCES__CONFLUENCE__",
@@ -55,6 +58,8 @@ class ConfluenceSecrets(BaseSettings):
 
 
 class DatasourceConfiguration(ConfigurationWithSecrets, ABC):
+    model_config = ConfigDict(frozen=True)
+
     name: DatasourceName = Field(
         ..., description="The name of the data source."
     )
@@ -73,11 +78,9 @@ class ConfluenceDatasourceConfiguration(DatasourceConfiguration):
     name: Literal[DatasourceName.CONFLUENCE] = Field(
         ..., description="The name of the data source."
     )
-    secrets: ConfluenceSecrets = Field(
-        None, description="The secrets for the data source."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = ConfluenceSecrets
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         return f"{self.protocol}://{self.host}"
 
@@ -94,9 +97,7 @@ class NotionDatasourceConfiguration(DatasourceConfiguration):
         3,
         description="Number of pages being exported ansychronously. Decrease to avoid NotionAPI rate limits, smaller batch slows the export down.",
     )
-    secrets: NotionSecrets = Field(
-        None, description="The secrets for the data source."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = NotionSecrets
 
 
 class PdfDatasourceConfiguration(DatasourceConfiguration):
@@ -127,14 +128,17 @@ class HackernewsDatasourceConfiguration(DatasourceConfiguration):
         ..., description="The name of the data source."
     )
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         return f"{self.protocol}://{self.host}"
 
 
-AVAIALBLE_DATASOURCES = Union[
-    NotionDatasourceConfiguration,
-    ConfluenceDatasourceConfiguration,
-    PdfDatasourceConfiguration,
-    HackernewsDatasourceConfiguration,
+AVAIALBLE_DATASOURCES = Annotated[
+    Union[
+        NotionDatasourceConfiguration,
+        ConfluenceDatasourceConfiguration,
+        PdfDatasourceConfiguration,
+        HackernewsDatasourceConfiguration,
+    ],
+    Field(discriminator="name"),
 ]
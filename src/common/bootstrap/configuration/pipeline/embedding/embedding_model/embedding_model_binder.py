@@ -44,9 +44,13 @@ class EmbeddingModelBinder(BaseBinder):
 
     def _bind_splitter(self) -> None:
         """Bind the embedding model markdown splitter."""
+        embedding_model_configuration = (
+            self.configuration.pipeline.embedding.embedding_model
+        )
         self.binder.bind(
             BoundEmbeddingModelMarkdownSplitter,
             to=lambda: MarkdownSplitterBuilder.build(
-                self.configuration.pipeline.embedding.embedding_model
+                embedding_model_configuration
             ),
+            scope=singleton,
         )
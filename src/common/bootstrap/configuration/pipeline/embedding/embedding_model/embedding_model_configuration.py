@@ -1,16 +1,18 @@
 from abc import ABC
 from enum import Enum
-from typing import Any, Callable, Literal, Optional, Union
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Annotated, Callable, ClassVar, Literal, Optional, Type, Union
 
-import tiktoken
 from pydantic import ConfigDict, Field, SecretStr
-from pydantic_settings import BaseSettings
-from transformers import AutoTokenizer
 
 from common.bootstrap.configuration.pipeline.embedding.embedding_model.splitting_configuration import (
     SplittingConfiguration,
 )
-from common.bootstrap.secrets_configuration import ConfigurationWithSecrets
+from common.bootstrap.secrets_configuration import (
+    BaseSecrets,
+    ConfigurationWithSecrets,
+)
 from common.builders.embedding_builders import (
     HuggingFaceEmbeddingModelBuilder,
     OpenAIEmbeddingModelBuilder,
@@ -18,6 +20,39 @@ from common.builders.embedding_builders import (
 )
 
 
+@lru_cache(maxsize=16)
+def _load_hugging_face_tokenizer(tokenizer_name: str) -> Callable:
+    """
+    Load the Hugging Face tokenizer. `transformers` is imported on first use and tokenizers are shared between configurations.
+    The Rust-backed fast tokenizer is requested explicitly, as splitting tokenizes every chunk.
+
+    Args:
+        tokenizer_name (str): The name of the tokenizer.
+
+    Returns:
+        Callable: The tokenize function.
+    """
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True).tokenize
+
+
+@lru_cache(maxsize=16)
+def _load_tiktoken_encoding(tokenizer_name: str) -> Callable:
+    """
+    Load the tiktoken encoding for the model. `tiktoken` is imported on first use and encodings are shared between configurations.
+
+    Args:
+        tokenizer_name (str): The name of the model.
+
+    Returns:
+        Callable: The encode function.
+    """
+    import tiktoken
+
+    return tiktoken.encoding_for_model(tokenizer_name).encode
+
+
 # Enums
 class EmbeddingModelProviderNames(str, Enum):
     HUGGING_FACE = "hugging_face"
@@ -25,8 +60,17 @@ class EmbeddingModelProviderNames(str, Enum):
     VOYAGE = "voyage"
 
 
+TOKENIZER_LOADERS = MappingProxyType(
+    {
+        EmbeddingModelProviderNames.HUGGING_FACE: _load_hugging_face_tokenizer,
+        EmbeddingModelProviderNames.OPENAI: _load_tiktoken_encoding,
+        EmbeddingModelProviderNames.VOYAGE: _load_hugging_face_tokenizer,
+    }
+)
+
+
 # Secrets
-class OpenAIEmbeddingModelSecrets(BaseSettings):
+class OpenAIEmbeddingModelSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAGKB__EMBEDDING_MODELS__OPEN_AI__",
@@ -39,7 +83,7 @@ class OpenAIEmbeddingModelSecrets(BaseSettings):
     )
 
 
-class VoyageSecrets(BaseSettings):
+class VoyageSecrets(BaseSecrets):
     model_config = ConfigDict(
         env_file_encoding="utf-8",
         env_prefix="RAGKB__EMBEDDING_MODELS__VOYAGE__",
@@ -56,6 +100,8 @@ class VoyageSecrets(BaseSettings):
 
 
 class EmbeddingModelConfiguration(ConfigurationWithSecrets, ABC):
+    model_config = ConfigDict(frozen=True)
+
     provider: EmbeddingModelProviderNames = Field(
         ..., description="The provider of the embedding model."
     )
@@ -69,31 +115,24 @@ class EmbeddingModelConfiguration(ConfigurationWithSecrets, ABC):
     splitting: Optional[SplittingConfiguration] = Field(
         None, description="The splitting configuration for the embedding model."
     )
-    tokenizer_func: Optional[Callable] = Field(
-        None,
-        description="The tokenizer function used by the embedding model.",
-        exclude=True,
-    )
 
-    def model_post_init(self, context: Any) -> None:
-        super().model_post_init(context)
-        self.tokenizer_func = self.get_tokenizer()
+    @cached_property
+    def tokenizer_func(self) -> Callable:
+        """
+        The tokenizer function used by the embedding model, loaded on first access.
+
+        Returns:
+            Callable: The tokenizer function.
+        """
+        return self.get_tokenizer()
 
     def get_tokenizer(self) -> Callable:
-        match self.provider:
-            case (
-                EmbeddingModelProviderNames.HUGGING_FACE
-                | EmbeddingModelProviderNames.VOYAGE
-            ):
-                return AutoTokenizer.from_pretrained(
-                    self.tokenizer_name
-                ).tokenize
-            case EmbeddingModelProviderNames.OPENAI:
-                return tiktoken.encoding_for_model(self.tokenizer_name).encode
-            case _:
-                raise ValueError(
-                    f"Tokenizer for `{self.provider}` provider not found."
-                )
+        loader = TOKENIZER_LOADERS.get(self.provider)
+        if loader is None:
+            raise ValueError(
+                f"Tokenizer for `{self.provider}` provider not found."
+            )
+        return loader(self.tokenizer_name)
 
 
 class HuggingFaceConfiguration(EmbeddingModelConfiguration):
@@ -117,9 +156,7 @@ class OpenAIEmbeddingModelConfiguration(EmbeddingModelConfiguration):
         8191,
         description="Maximum size of the request in tokens.",
     )
-    secrets: OpenAIEmbeddingModelSecrets = Field(
-        None, description="The secrets for the language model."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = OpenAIEmbeddingModelSecrets
 
     builder: Callable = Field(
         OpenAIEmbeddingModelBuilder.build,
@@ -130,9 +167,12 @@ class OpenAIEmbeddingModelConfiguration(EmbeddingModelConfiguration):
     def model_post_init(self, __context):
         super().model_post_init(__context)
         if self.splitting:
-            self.batch_size = (
+            # The model is frozen, the derived batch size is set once here
+            object.__setattr__(
+                self,
+                "batch_size",
                 self.max_request_size_in_tokens
-                // self.splitting.chunk_size_in_tokens
+                // self.splitting.chunk_size_in_tokens,
             )
 
 
@@ -141,9 +181,7 @@ class VoyageConfiguration(EmbeddingModelConfiguration):
     provider: Literal[EmbeddingModelProviderNames.VOYAGE] = Field(
         ..., description="The provider of the embedding model."
     )
-    secrets: VoyageSecrets = Field(
-        None, description="The secrets for the language model."
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = VoyageSecrets
 
     builder: Callable = Field(
         VoyageEmbeddingModelBuilder.build,
@@ -152,8 +190,11 @@ class VoyageConfiguration(EmbeddingModelConfiguration):
     )
 
 
-AVAILABLE_EMBEDDING_MODELS = Union[
-    OpenAIEmbeddingModelConfiguration,
-    HuggingFaceConfiguration,
-    VoyageConfiguration,
+AVAILABLE_EMBEDDING_MODELS = Annotated[
+    Union[
+        OpenAIEmbeddingModelConfiguration,
+        HuggingFaceConfiguration,
+        VoyageConfiguration,
+    ],
+    Field(discriminator="provider"),
 ]
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from chromadb.api import ClientAPI as ChromaClient
 from injector import singleton
 from llama_index.core.vector_stores.types import VectorStore
@@ -111,10 +113,12 @@ class ChromaBinder(BaseBinder):
 class VectorStoreBinder(BaseBinder):
     """Binder for the vector store component."""
 
-    mapping = {
-        VectorStoreName.QDRANT: QdrantBinder,
-        VectorStoreName.CHROMA: ChromaBinder,
-    }
+    mapping = MappingProxyType(
+        {
+            VectorStoreName.QDRANT: QdrantBinder,
+            VectorStoreName.CHROMA: ChromaBinder,
+        }
+    )
 
     def bind(self) -> None:
         """Bind specific vector store based on the configuration."""
@@ -1,6 +1,6 @@
 from abc import ABC
 from enum import Enum
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
 from pydantic import BaseModel, Field
 
@@ -57,4 +57,7 @@ class ChromaConfiguration(VectorStoreConfiguration):
     )
 
 
-AVAILABLE_VECTOR_STORES = Union[QDrantConfiguration, ChromaConfiguration]
+AVAILABLE_VECTOR_STORES = Annotated[
+    Union[QDrantConfiguration, ChromaConfiguration],
+    Field(discriminator="name"),
+]
@@ -39,12 +39,11 @@ class EvaluationBinder(BaseBinder):
         judge_llm_configuration = (
             self.configuration.pipeline.evaluation.judge_llm
         )
-        llm_configuration = (
-            self.configuration.pipeline.augmentation.query_engine.synthesizer.llm
-        )
-        retriever_configuration = (
-            self.configuration.pipeline.augmentation.query_engine.retriever
+        query_engine_configuration = (
+            self.configuration.pipeline.augmentation.query_engine
         )
+        llm_configuration = query_engine_configuration.synthesizer.llm
+        retriever_configuration = query_engine_configuration.retriever
 
         if self._pydantic_config_is_equal(
             judge_llm_configuration, llm_configuration
@@ -54,9 +53,10 @@ class EvaluationBinder(BaseBinder):
                 to=self._get_bind(BoundLLM),
                 scope=singleton,
             )
-        elif (
-            isinstance(retriever_configuration, AutoRetrieverConfiguration)
-            and retriever_configuration.llm == judge_llm_configuration
+        elif isinstance(
+            retriever_configuration, AutoRetrieverConfiguration
+        ) and self._pydantic_config_is_equal(
+            judge_llm_configuration, retriever_configuration.llm
         ):
             self.binder.bind(
                 BoundJudgeLLM,
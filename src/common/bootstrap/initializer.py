@@ -1,6 +1,8 @@
 import argparse
+import os
 import time
 from abc import ABC
+from functools import lru_cache
 from typing import Tuple
 
 import chainlit.data as cl_data
@@ -35,6 +37,24 @@ from common.bootstrap.configuration.pipeline.evaluation.evaluation_binder import
 from common.logger import LoggerConfiguration
 
 
+@lru_cache(maxsize=4)
+def _parse_configuration(
+    configuration_json: bytes, secrets_filepath: str
+) -> Configuration:
+    """Validate the configuration. Results are cached per file content and secrets file, so repeated initializers reuse the validated configuration.
+
+    Args:
+        configuration_json: Configuration JSON bytes
+        secrets_filepath: Path to the secrets file
+
+    Returns:
+        Configuration: Validated configuration
+    """
+    return Configuration.model_validate_json(
+        configuration_json, context={"secrets_file": secrets_filepath}
+    )
+
+
 class CommonInitializer(ABC):
     """Common initializer for embedding, augmentation and evaluation processes.
 
@@ -44,7 +64,7 @@ class CommonInitializer(ABC):
 
     Attributes:
         configuration: Configuration object
-        configuration_json: Configuration JSON string
+        configuration_json: Configuration JSON bytes
     """
 
     def __init__(self):
@@ -60,16 +80,25 @@ class CommonInitializer(ABC):
         build_name = args.build_name
         environment = args.env
 
-        with open(configuration_filepath) as f:
+        with open(configuration_filepath, "rb") as f:
             self.configuration_json = f.read()
-        self.configuration = Configuration.model_validate_json(
-            self.configuration_json, context={"secrets_file": secrets_filepath}
+        self.configuration = _parse_configuration(
+            self.configuration_json, secrets_filepath
+        )
+        self.configuration = self.configuration.model_copy(
+            update={
+                "metadata": self.configuration.metadata.model_copy(
+                    update={
+                        "build_name": build_name,
+                        "environment": EnvironmentName(environment),
+                    }
+                )
+            }
         )
-        self.configuration.metadata.build_name = build_name
-        self.configuration.metadata.environment = EnvironmentName(environment)
 
-        print(f"::{configuration_filepath}")
-        print(self.configuration.model_dump_json(indent=4))
+        if os.environ.get("RAG_DEBUG_CONFIG"):
+            print(f"::{configuration_filepath}")
+            print(self.configuration.model_dump_json(indent=4))
 
         LoggerConfiguration.config()  # TODO: Pass log level from configuration
         LoggerConfiguration.filterwarnings()
@@ -1,51 +1,206 @@
 from abc import ABC
-from typing import Any
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple, Type
 
-from pydantic import BaseModel, ConfigDict, Field
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from pydantic_settings.sources import parse_env_vars
 
+SECRETS_FILE_KWARG = "_secrets_file"
 
-class EmptySecrets(BaseSettings):
+
+@lru_cache(maxsize=8)
+def _parse_secrets_file(
+    secrets_file: str, modification_time: int, encoding: Optional[str]
+) -> Dict[str, Optional[str]]:
+    """
+    Parse the secrets file. Results are cached per path and modification time, so the file is read once no matter how many secrets classes use it.
+
+    Args:
+        secrets_file (str): The path to the secrets file.
+        modification_time (int): The modification time of the file, used as part of the cache key.
+        encoding (Optional[str]): The encoding of the file.
+
+    Returns:
+        Dict[str, Optional[str]]: The variables defined in the secrets file.
+    """
+    return dotenv_values(secrets_file, encoding=encoding)
+
+
+def read_secrets_file(
+    secrets_file: str, encoding: Optional[str] = "utf-8"
+) -> Mapping[str, Optional[str]]:
+    """
+    Read the secrets file through the parse cache.
+
+    Args:
+        secrets_file (str): The path to the secrets file.
+        encoding (Optional[str]): The encoding of the file.
+
+    Returns:
+        Mapping[str, Optional[str]]: The variables defined in the secrets file, empty if the file does not exist.
+    """
+    path = Path(secrets_file).expanduser()
+    if not path.is_file():
+        return {}
+    return _parse_secrets_file(str(path), path.stat().st_mtime_ns, encoding)
+
+
+class SecretsFileSettingsSource(EnvSettingsSource):
+    """
+    Settings source reading variables from the cached secrets file mapping instead of reparsing the file.
+    """
+
+    def __init__(
+        self,
+        settings_cls: Type[BaseSettings],
+        secrets_file: Optional[str],
+        **kwargs: Any,
+    ) -> None:
+        self.secrets_file = secrets_file
+        self.secrets_file_encoding = settings_cls.model_config.get(
+            "env_file_encoding", "utf-8"
+        )
+        super().__init__(settings_cls, **kwargs)
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        if self.secrets_file is None:
+            return {}
+        return parse_env_vars(
+            read_secrets_file(self.secrets_file, self.secrets_file_encoding),
+            self.case_sensitive,
+            self.env_ignore_empty,
+            self.env_parse_none_str,
+        )
+
+
+class BaseSecrets(BaseSettings):
+    """
+    Base class for secrets. The secrets file is passed with `_secrets_file` keyword and read from the cached mapping, environment variables take precedence over it.
+    Secrets are frozen, as instances are cached and shared between configurations.
+    """
+
+    model_config = SettingsConfigDict(frozen=True)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        secrets_file = init_settings.init_kwargs.pop(SECRETS_FILE_KWARG, None)
+        secrets_file_settings = SecretsFileSettingsSource(
+            settings_cls,
+            secrets_file=secrets_file,
+            case_sensitive=env_settings.case_sensitive,
+            env_prefix=env_settings.env_prefix,
+            env_nested_delimiter=env_settings.env_nested_delimiter,
+            env_ignore_empty=env_settings.env_ignore_empty,
+            env_parse_none_str=env_settings.env_parse_none_str,
+        )
+        return (
+            init_settings,
+            env_settings,
+            secrets_file_settings,
+            file_secret_settings,
+        )
+
+
+class EmptySecrets(BaseSecrets):
     model_config = ConfigDict(
         extra="ignore",
     )
 
 
+@lru_cache(maxsize=None)
+def _get_secrets(
+    secrets_class: Type[BaseSecrets], secrets_file: Optional[str]
+) -> BaseSecrets:
+    """
+    Instantiate the secrets class once per secrets file, so repeated configurations share the validated secrets.
+
+    Args:
+        secrets_class (Type[BaseSecrets]): The secrets class to instantiate.
+        secrets_file (Optional[str]): The path to the secrets file.
+
+    Returns:
+        BaseSecrets: The secrets object.
+    """
+    return secrets_class(**{SECRETS_FILE_KWARG: secrets_file})
+
+
+def clear_secrets_cache() -> None:
+    """
+    Drop cached secrets and parsed secrets files, e.g. between tests that change environment variables.
+    Configurations that already accessed `secrets` keep their loaded instance.
+    """
+    _get_secrets.cache_clear()
+    _parse_secrets_file.cache_clear()
+
+
 class ConfigurationWithSecrets(BaseModel, ABC):
     """
-    Abstract model for configuration's secrets handling. Extending class has to implement `secrets` field with correspodning type.
+    Abstract model for configuration's secrets handling. Extending class has to set `_secrets_class` to the corresponding secrets class, `EmptySecrets` is meant for the configuration that does not require secrets.
+    Secrets are loaded on first access of `secrets`.
     """
 
-    secrets: EmptySecrets = Field(
-        None,
-        description="`EmptySecrets` is meant for the the configuration that does not require secrets."
-        "In other case `EmptySecrets` should be replaced with the corresponding secrets class.",
-    )
+    _secrets_class: ClassVar[Type[BaseSecrets]] = EmptySecrets
+    _secrets_file: Optional[str] = PrivateAttr(None)
 
     def model_post_init(self, context: Any) -> None:
         """
-        Function is invoked after the model is initialized. It is used to initialize secrets.
+        Function is invoked after the model is initialized. It is used to store the secrets file for lazy secrets loading.
 
         Args:
             context (Any): The context passed to the pydantic model.
         """
-        self.secrets = self.get_secrets(secrets_file=context["secrets_file"])
+        if context is None:
+            return
+        self._secrets_file = context["secrets_file"]
+        # Nested configurations created by `default_factory` are not validated with the context
+        for value in self.__dict__.values():
+            if (
+                isinstance(value, ConfigurationWithSecrets)
+                and value._secrets_file is None
+            ):
+                value._secrets_file = self._secrets_file
+
+    @cached_property
+    def secrets(self) -> BaseSecrets:
+        """
+        Secrets of the configuration, loaded on first access.
+
+        Returns:
+            BaseSecrets: The secrets object.
+        """
+        return self.get_secrets(secrets_file=self._secrets_file)
 
-    def get_secrets(self, secrets_file: str) -> BaseSettings:
+    def get_secrets(self, secrets_file: Optional[str]) -> BaseSecrets:
         """
         Function to initialize secrets.
 
         Args:
-            secrets_file (str): The path to the secrets file.
+            secrets_file (Optional[str]): The path to the secrets file.
 
         Returns:
-            BaseSettings: The secrets object.
+            BaseSecrets: The secrets object.
 
         Raises:
-            ValueError: If secrets are not found.
+            ValueError: If the secrets class is not set.
         """
-        secrets_class = self.model_fields["secrets"].annotation
-        secrets = secrets_class(_env_file=secrets_file)
-        if secrets is None:
-            raise ValueError(f"Secrets for {self.name} not found.")
-        return secrets
+        secrets_class = type(self)._secrets_class
+        if secrets_class is None:
+            raise ValueError(
+                f"Secrets class for {type(self).__name__} not found."
+            )
+        return _get_secrets(secrets_class, secrets_file)
@@ -56,7 +56,7 @@ class OpenAILikeBuilder:
         return OpenAILike(
             api_base=configuration.secrets.api_base.get_secret_value(),
             api_key=configuration.secrets.api_key.get_secret_value(),
-            model=configuration.name.value,
+            model=configuration.name,
             max_tokens=configuration.max_tokens,
             max_retries=configuration.max_retries,
             context_window=configuration.context_window,
@@ -1,5 +1,5 @@
 from injector import inject
-from llama_index.postprocessor.colbert_rerank import ColbertRerank
+from llama_index.core.postprocessor.types import BaseNodePostprocessor
 
 from common.bootstrap.configuration.pipeline.augmentation.query_engine.postprocessors.postprocessors_configuration import (
     ColbertRerankConfiguration,
@@ -14,15 +14,20 @@ class ColbertRerankBuilder:
 
     @staticmethod
     @inject
-    def build(configuration: ColbertRerankConfiguration) -> ColbertRerank:
+    def build(
+        configuration: ColbertRerankConfiguration,
+    ) -> BaseNodePostprocessor:
         """Creates a configured ColBERT reranking postprocessor.
 
         Args:
             configuration: Settings for ColBERT reranking including model and scoring.
 
         Returns:
-            ColbertRerank: Configured reranking postprocessor instance.
+            BaseNodePostprocessor: Configured ColbertRerank postprocessor instance.
         """
+        # Imported on demand, the reranker pulls in torch and transformers
+        from llama_index.postprocessor.colbert_rerank import ColbertRerank
+
         return ColbertRerank(
             top_n=configuration.top_n,
             model=configuration.model.value,
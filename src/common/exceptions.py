@@ -34,3 +34,27 @@ class TraceNotFoundException(Exception):
         self.message_id = message_id
         self.message = f"Trace for message with id {message_id} not found"
         super().__init__(self.message)
+
+
+class ObservationNotFoundException(Exception):
+    """Exception raised when a trace has no observation with a given name.
+
+    Attributes:
+        trace_id: ID of the trace whose observation was not found.
+        name: Name of the observation that was not found.
+        message: Explanation of the error.
+    """
+
+    def __init__(self, trace_id: str, name: str) -> None:
+        """Initialize the exception.
+
+        Args:
+            trace_id: ID of the trace whose observation was not found.
+            name: Name of the observation that was not found.
+        """
+        self.trace_id = trace_id
+        self.name = name
+        self.message = (
+            f"Observation {name} for trace with id {trace_id} not found"
+        )
+        super().__init__(self.message)
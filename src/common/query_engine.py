@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import List
+from functools import cached_property
+from typing import List, Tuple
 
 from langfuse.client import StatefulTraceClient
 from langfuse.llama_index.llama_index import LlamaIndexCallbackHandler
@@ -12,6 +13,10 @@ from llama_index.core.retrievers import BaseRetriever
 from llama_index.core.schema import QueryBundle, QueryType
 from pydantic import Field
 
+from common.bootstrap.configuration.pipeline.augmentation.langfuse.langfuse_configuration import (
+    split_chainlit_tag_format,
+)
+
 
 class SourceProcess(Enum):
     """Enumeration of possible query processing sources.
@@ -55,6 +60,15 @@ class RagQueryEngine(CustomQueryEngine):
         description="Format of the tag used to retrieve the trace by chainlit message id in Langfuse."
     )
 
+    @cached_property
+    def _chainlit_tag_affixes(self) -> Tuple[str, str]:
+        """Parts of the Chainlit tag around the message ID, split once per engine.
+
+        Returns:
+            Tuple[str, str]: Tag prefix and suffix
+        """
+        return split_chainlit_tag_format(self.chainlit_tag_format)
+
     def query(
         self,
         str_or_query_bundle: QueryType,
@@ -148,11 +162,12 @@ class RagQueryEngine(CustomQueryEngine):
             message_id: Chainlit message identifier
             source_process: Source context of the query
         """
+        prefix, suffix = self._chainlit_tag_affixes
         for handler in self.callback_manager.handlers:
             if isinstance(handler, LlamaIndexCallbackHandler):
                 handler.set_trace_params(
                     tags=[
-                        self.chainlit_tag_format.format(message_id=message_id),
+                        f"{prefix}{message_id}{suffix}",
                         source_process.name.lower(),
                     ]
                 )
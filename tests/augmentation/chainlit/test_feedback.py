@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from unittest.mock import Mock
 from uuid import uuid4
@@ -105,6 +106,12 @@ class Arrangements:
         )
         return self
 
+    def on_fetch_observation_return_no_observations(self) -> "Arrangements":
+        self.langfuse_client.fetch_observations.return_value = (
+            FetchObservationsResponse(data=[], meta=None)
+        )
+        return self
+
 
 class Assertions:
 
@@ -126,10 +133,15 @@ class Assertions:
                 self.arrangements.chainlit_tag_format.format(
                     message_id=self.fixtures.message_id
                 )
-            ]
+            ],
+            limit=1,
         )
         return self
 
+    def assert_fetch_traces_called_once(self) -> "Assertions":
+        self.arrangements.langfuse_client.fetch_traces.assert_called_once()
+        return self
+
     def assert_score_called(self) -> "Assertions":
         self.arrangements.langfuse_client.score.assert_called_with(
             trace_id=self.fixtures.trace.id,
@@ -151,6 +163,10 @@ class Assertions:
         self.arrangements.langfuse_client.create_dataset_item.assert_not_called()
         return self
 
+    def assert_no_trace_locks_left(self) -> "Assertions":
+        assert self.arrangements.service._trace_locks == {}
+        return self
+
 
 class Manager:
 
@@ -233,3 +249,66 @@ class TestChainlitFeedbackService:
         manager.assertions.assert_result_is_true(
             result
         ).assert_score_called().assert_create_dataset_item_called()
+
+    @pytest.mark.asyncio
+    async def test_given_no_observations_when_upsert_then_feedback_not_upserted(
+        self,
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(Fixtures().with_positive_feedback().with_trace())
+            .on_fetch_traces_return_trace()
+            .on_fetch_observation_return_no_observations()
+        )
+        service = manager.get_service()
+
+        # Act
+        result = await service.upsert(manager.fixtures.feedback)
+
+        # Assert
+        manager.assertions.assert_result_is_false(
+            result
+        ).assert_score_never_called().assert_create_dataset_item_never_called()
+
+    @pytest.mark.asyncio
+    async def test_given_repeated_feedback_when_upsert_then_trace_fetched_once(
+        self,
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_negative_feedback().with_trace()
+            ).on_fetch_traces_return_trace()
+        )
+        service = manager.get_service()
+
+        # Act
+        await service.upsert(manager.fixtures.feedback)
+        result = await service.upsert(manager.fixtures.feedback)
+
+        # Assert
+        manager.assertions.assert_result_is_true(
+            result
+        ).assert_fetch_traces_called_once().assert_score_called()
+
+    @pytest.mark.asyncio
+    async def test_given_concurrent_feedback_when_upsert_then_trace_fetched_once(
+        self,
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_negative_feedback().with_trace()
+            ).on_fetch_traces_return_trace()
+        )
+        service = manager.get_service()
+
+        # Act
+        results = await asyncio.gather(
+            *(service.upsert(manager.fixtures.feedback) for _ in range(3))
+        )
+
+        # Assert
+        assert all(results)
+        manager.assertions.assert_fetch_traces_called_once()
+        manager.assertions.assert_no_trace_locks_left()
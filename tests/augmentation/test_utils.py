@@ -3,6 +3,7 @@ import sys
 sys.path.append("./src")
 
 from unittest.mock import Mock
+from uuid import uuid4
 
 import pytest
 from chainlit import Message
@@ -40,6 +41,9 @@ class Fixtures:
 
     def _create_node(self, index: str = "1") -> NodeWithScore:
         node = Mock(spec=NodeWithScore)
+        node.node = Mock()
+        node.node.ref_doc_id = f"document {index}"
+        node.node.node_id = str(uuid4())
         node.metadata = {}
         node.metadata["title"] = f"title {index}"
         node.metadata["url"] = f"url {index}"
@@ -64,18 +68,16 @@ class Assertions:
         assert (
             self.fixtures.message.content
             == self.fixtures.message_prefix
-            + ConversationUtils.REFERENCES_TEMPLATE.format(
-                references="\n".join(self._get_unique_nodes_str())
-            )
+            + "\n\n**References**:\n"
+            + "\n".join(self._get_unique_nodes_str())
+            + "\n"
         )
         return self
 
     def _get_unique_nodes_str(self):
-        return set(
-            [
-                self._node_to_str(node)
-                for node in self.fixtures.response.source_nodes
-            ]
+        return dict.fromkeys(
+            self._node_to_str(node)
+            for node in self.fixtures.response.source_nodes
         )
 
     def _node_to_str(self, node: NodeWithScore) -> str:
@@ -0,0 +1,206 @@
+import sys
+
+sys.path.append("./src")
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from common.bootstrap.configuration.pipeline.augmentation.langfuse.langfuse_configuration import (
+    LangfuseConfiguration,
+    LangfuseDatabaseConfiguration,
+)
+from common.bootstrap.secrets_configuration import clear_secrets_cache
+
+
+class Fixtures:
+
+    def __init__(self, tmp_path: Path):
+        self.secrets_file: Path = tmp_path / "secrets.env"
+        self.secrets: dict = {}
+        self.environment: dict = {}
+
+    def with_file_secrets(self) -> "Fixtures":
+        self.secrets = {
+            "RAG__LANGFUSE__DATABASE__USER": "file_user",
+            "RAG__LANGFUSE__DATABASE__PASSWORD": "file_password",
+        }
+        return self
+
+    def with_environment_user(self, user: str = "env_user") -> "Fixtures":
+        self.environment = {"RAG__LANGFUSE__DATABASE__USER": user}
+        return self
+
+
+class Arrangements:
+
+    def __init__(self, fixtures: Fixtures, monkeypatch: pytest.MonkeyPatch):
+        self.fixtures = fixtures
+        self.monkeypatch = monkeypatch
+        for name in (
+            "RAG__LANGFUSE__DATABASE__USER",
+            "RAG__LANGFUSE__DATABASE__PASSWORD",
+        ):
+            monkeypatch.delenv(name, raising=False)
+        clear_secrets_cache()
+
+    def with_secrets_file(self) -> "Arrangements":
+        self.fixtures.secrets_file.write_text(
+            "\n".join(
+                f"{name}={value}"
+                for name, value in self.fixtures.secrets.items()
+            )
+        )
+        return self
+
+    def with_environment(self) -> "Arrangements":
+        for name, value in self.fixtures.environment.items():
+            self.monkeypatch.setenv(name, value)
+        return self
+
+    def get_database_configuration(self) -> LangfuseDatabaseConfiguration:
+        return LangfuseDatabaseConfiguration.model_validate(
+            {}, context={"secrets_file": str(self.fixtures.secrets_file)}
+        )
+
+    def get_langfuse_configuration(self) -> LangfuseConfiguration:
+        return LangfuseConfiguration.model_validate(
+            {}, context={"secrets_file": str(self.fixtures.secrets_file)}
+        )
+
+
+class Assertions:
+
+    def __init__(self, arrangements: Arrangements):
+        self.fixtures = arrangements.fixtures
+        self.arrangements = arrangements
+
+    def assert_secrets(
+        self,
+        configuration: LangfuseDatabaseConfiguration,
+        user: str,
+        password: str = "file_password",
+    ) -> "Assertions":
+        assert configuration.secrets.user.get_secret_value() == user
+        assert configuration.secrets.password.get_secret_value() == password
+        return self
+
+    def assert_secrets_not_loaded(
+        self, configuration: LangfuseDatabaseConfiguration
+    ) -> "Assertions":
+        assert "secrets" not in configuration.__dict__
+        return self
+
+    def assert_secrets_file_passed(
+        self, configuration: LangfuseDatabaseConfiguration
+    ) -> "Assertions":
+        assert configuration._secrets_file == str(self.fixtures.secrets_file)
+        return self
+
+
+class Manager:
+
+    def __init__(self, arrangements: Arrangements):
+        self.fixtures = arrangements.fixtures
+        self.arrangements = arrangements
+        self.assertions = Assertions(arrangements)
+
+
+class TestConfigurationWithSecrets:
+
+    def test_given_secrets_file_and_environment_when_secrets_then_environment_takes_precedence(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(tmp_path).with_file_secrets().with_environment_user(),
+                monkeypatch,
+            )
+            .with_secrets_file()
+            .with_environment()
+        )
+
+        # Act
+        configuration = manager.arrangements.get_database_configuration()
+
+        # Assert
+        manager.assertions.assert_secrets(configuration, user="env_user")
+
+    def test_given_missing_secrets_when_configuration_validated_then_secrets_loaded_on_first_access(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        manager = Manager(Arrangements(Fixtures(tmp_path), monkeypatch))
+
+        # Act
+        configuration = manager.arrangements.get_database_configuration()
+
+        # Assert
+        manager.assertions.assert_secrets_not_loaded(configuration)
+        with pytest.raises(ValidationError):
+            configuration.secrets
+
+    def test_given_secrets_file_written_after_validation_when_secrets_then_file_secrets_loaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(Fixtures(tmp_path).with_file_secrets(), monkeypatch)
+        )
+        configuration = manager.arrangements.get_database_configuration()
+        manager.arrangements.with_secrets_file()
+
+        # Act
+        user = configuration.secrets.user.get_secret_value()
+
+        # Assert
+        assert user == "file_user"
+
+    def test_given_default_factory_child_when_secrets_then_secrets_file_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(tmp_path).with_file_secrets(), monkeypatch
+            ).with_secrets_file()
+        )
+
+        # Act
+        configuration = manager.arrangements.get_langfuse_configuration()
+
+        # Assert
+        manager.assertions.assert_secrets_file_passed(
+            configuration.database
+        ).assert_secrets(configuration.database, user="file_user")
+
+    def test_given_changed_environment_when_clear_secrets_cache_then_secrets_reloaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(tmp_path).with_file_secrets().with_environment_user(),
+                monkeypatch,
+            )
+            .with_secrets_file()
+            .with_environment()
+        )
+        manager.arrangements.get_database_configuration().secrets
+        manager.fixtures.with_environment_user("changed_user")
+        manager.arrangements.with_environment()
+
+        # Act
+        cached_user = (
+            manager.arrangements.get_database_configuration().secrets.user
+        )
+        clear_secrets_cache()
+        reloaded_user = (
+            manager.arrangements.get_database_configuration().secrets.user
+        )
+
+        # Assert
+        assert cached_user.get_secret_value() == "env_user"
+        assert reloaded_user.get_secret_value() == "changed_user"